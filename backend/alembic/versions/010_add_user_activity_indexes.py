@@ -0,0 +1,33 @@
+"""Add partial indexes for premium and active user lookups
+
+Revision ID: 010
+Revises: 009
+Create Date: 2024-01-01
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_user_profiles_premium_until',
+        'user_profiles',
+        ['premium_until'],
+        postgresql_where=sa.text('premium_until IS NOT NULL'),
+    )
+    op.create_index(
+        'ix_users_last_login_at',
+        'users',
+        ['last_login_at'],
+        postgresql_where=sa.text('last_login_at IS NOT NULL'),
+    )
+
+
+def downgrade():
+    op.drop_index('ix_users_last_login_at', 'users')
+    op.drop_index('ix_user_profiles_premium_until', 'user_profiles')
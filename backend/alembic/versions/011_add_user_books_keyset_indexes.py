@@ -0,0 +1,31 @@
+"""Add keyset pagination indexes on user_books
+
+Revision ID: 011
+Revises: 010
+Create Date: 2024-01-01
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_user_books_user_updated',
+        'user_books',
+        ['user_id', sa.text('updated_at DESC'), sa.text('id DESC')],
+    )
+    op.create_index(
+        'ix_user_books_user_status_updated',
+        'user_books',
+        ['user_id', 'status', sa.text('updated_at DESC'), sa.text('id DESC')],
+    )
+
+
+def downgrade():
+    op.drop_index('ix_user_books_user_status_updated', 'user_books')
+    op.drop_index('ix_user_books_user_updated', 'user_books')
@@ -0,0 +1,33 @@
+"""Add list ordering indexes on quotes and reviews
+
+Revision ID: 012
+Revises: 011
+Create Date: 2024-01-01
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    for table in ('quotes', 'reviews'):
+        op.create_index(
+            f'ix_{table}_book_created',
+            table,
+            ['book_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        )
+        op.create_index(
+            f'ix_{table}_user_created',
+            table,
+            ['user_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        )
+
+
+def downgrade():
+    for table in ('reviews', 'quotes'):
+        op.drop_index(f'ix_{table}_user_created', table)
+        op.drop_index(f'ix_{table}_book_created', table)
@@ -0,0 +1,36 @@
+"""Add materialized trending views for quotes and reviews
+
+Revision ID: 013
+Revises: 012
+Create Date: 2024-01-01
+"""
+from alembic import op
+
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+PERIODS = {'day': 1, 'week': 7, 'month': 30}
+
+
+def upgrade():
+    for table in ('quotes', 'reviews'):
+        for period, days in PERIODS.items():
+            view = f'trending_{table}_{period}'
+            op.execute(f"""
+                CREATE MATERIALIZED VIEW {view} AS
+                SELECT id, likes_count, created_at
+                FROM {table}
+                WHERE is_public AND created_at >= now() - interval '{days} days'
+                ORDER BY likes_count DESC NULLS LAST
+                LIMIT 1000
+            """)
+            # Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+            op.execute(f'CREATE UNIQUE INDEX ix_{view}_id ON {view} (id)')
+
+
+def downgrade():
+    for table in ('reviews', 'quotes'):
+        for period in PERIODS:
+            op.execute(f'DROP MATERIALIZED VIEW IF EXISTS trending_{table}_{period}')
@@ -0,0 +1,35 @@
+"""Add partial feed ordering indexes on public quotes and reviews
+
+Revision ID: 014
+Revises: 013
+Create Date: 2024-01-01
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '014'
+down_revision = '013'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    for table in ('quotes', 'reviews'):
+        op.create_index(
+            f'ix_{table}_public_created',
+            table,
+            [sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_where=sa.text('is_public'),
+        )
+        op.create_index(
+            f'ix_{table}_public_likes',
+            table,
+            [sa.text('likes_count DESC NULLS LAST'), sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_where=sa.text('is_public'),
+        )
+
+
+def downgrade():
+    for table in ('reviews', 'quotes'):
+        op.drop_index(f'ix_{table}_public_likes', table)
+        op.drop_index(f'ix_{table}_public_created', table)
@@ -0,0 +1,30 @@
+"""Add denormalized comments_count to reviews
+
+Revision ID: 015
+Revises: 014
+Create Date: 2024-01-01
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '015'
+down_revision = '014'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('reviews', sa.Column('comments_count', sa.Integer(), server_default='0', nullable=False))
+    op.execute("""
+        UPDATE reviews SET comments_count = counts.n
+        FROM (
+            SELECT parent_id, COUNT(*) AS n FROM comments
+            WHERE parent_type = 'review'
+            GROUP BY parent_id
+        ) AS counts
+        WHERE reviews.id = counts.parent_id
+    """)
+
+
+def downgrade():
+    op.drop_column('reviews', 'comments_count')
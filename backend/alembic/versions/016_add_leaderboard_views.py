@@ -0,0 +1,63 @@
+"""Add materialized leaderboard views for reading time and completed books
+
+Revision ID: 016
+Revises: 015
+Create Date: 2024-01-01
+"""
+from alembic import op
+
+revision = '016'
+down_revision = '015'
+branch_labels = None
+depends_on = None
+
+# Period start per leaderboard period; all_time has no lower bound
+PERIODS = {
+    'daily': "date_trunc('day', now())",
+    'weekly': "date_trunc('week', now())",
+    'monthly': "date_trunc('month', now())",
+    'all_time': "'-infinity'::timestamptz",
+}
+
+# Per-user score over the period, given its start expression
+SCORES = {
+    'reading_time': """
+        SELECT ub.user_id, SUM(rs.duration_sec) / 60 AS score
+        FROM reading_sessions rs
+        JOIN user_books ub ON ub.id = rs.user_book_id
+        WHERE rs.started_at >= {start}
+        GROUP BY ub.user_id
+    """,
+    'books_completed': """
+        SELECT user_id, COUNT(*) AS score
+        FROM user_books
+        WHERE status = 'completed' AND finished_at >= {start}
+        GROUP BY user_id
+    """,
+}
+
+
+def upgrade():
+    for leaderboard_type, score_sql in SCORES.items():
+        for period, start in PERIODS.items():
+            view = f'lb_{leaderboard_type}_{period}'
+            op.execute(f"""
+                CREATE MATERIALIZED VIEW {view} AS
+                SELECT
+                    scores.user_id,
+                    scores.score::int AS score,
+                    COALESCE(ul.level, 1) AS level,
+                    RANK() OVER (ORDER BY scores.score DESC)::int AS rank
+                FROM ({score_sql.format(start=start)}) AS scores
+                LEFT JOIN user_levels ul ON ul.user_id = scores.user_id
+                WHERE scores.score > 0
+            """)
+            # Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+            op.execute(f'CREATE UNIQUE INDEX ix_{view}_user ON {view} (user_id)')
+            op.execute(f'CREATE INDEX ix_{view}_rank ON {view} (rank)')
+
+
+def downgrade():
+    for leaderboard_type in SCORES:
+        for period in PERIODS:
+            op.execute(f'DROP MATERIALIZED VIEW IF EXISTS lb_{leaderboard_type}_{period}')
@@ -0,0 +1,26 @@
+"""Add an ordering index for the reading streak leaderboard
+
+Revision ID: 017
+Revises: 016
+Create Date: 2024-01-01
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '017'
+down_revision = '016'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_reading_streaks_current_streak',
+        'reading_streaks',
+        [sa.text('current_streak DESC'), 'user_id'],
+        postgresql_where=sa.text('current_streak > 0'),
+    )
+
+
+def downgrade():
+    op.drop_index('ix_reading_streaks_current_streak', 'reading_streaks')
@@ -16,7 +16,11 @@ def get_recommendation_service() -> RecommendationService:
     return RecommendationService()
 
 
-@router.get("/personalized", response_model=RecommendationListResponse)
+@router.get(
+    "/personalized",
+    response_model=None,
+    responses={200: {"model": RecommendationListResponse}},
+)
 async def get_personalized_recommendations(
     limit: int = Query(10, ge=1, le=50),
     current_user: dict = Depends(get_current_user),
@@ -26,7 +30,11 @@ async def get_personalized_recommendations(
     return await service.get_personalized(user_id=current_user.user_id, limit=limit)
 
 
-@router.get("/similar/{book_id}", response_model=SimilarBooksResponse)
+@router.get(
+    "/similar/{book_id}",
+    response_model=None,
+    responses={200: {"model": SimilarBooksResponse}},
+)
 async def get_similar_books(
     book_id: str,
     limit: int = Query(10, ge=1, le=20),
@@ -37,7 +45,11 @@ async def get_similar_books(
     return await service.get_similar_books(book_id=book_id, limit=limit)
 
 
-@router.get("/trending", response_model=RecommendationListResponse)
+@router.get(
+    "/trending",
+    response_model=None,
+    responses={200: {"model": RecommendationListResponse}},
+)
 async def get_trending_books(
     period: str = Query("week", pattern="^(day|week|month)$"),
     genre: Optional[str] = Query(None),
@@ -49,7 +61,11 @@ async def get_trending_books(
     return await service.get_trending(period=period, genre=genre, limit=limit)
 
 
-@router.get("/by-mood", response_model=RecommendationListResponse)
+@router.get(
+    "/by-mood",
+    response_model=None,
+    responses={200: {"model": RecommendationListResponse}},
+)
 async def get_books_by_mood(
     mood: str = Query(..., min_length=1, max_length=50),
     limit: int = Query(10, ge=1, le=20),
@@ -60,7 +76,11 @@ async def get_books_by_mood(
     return await service.get_by_mood(mood=mood, user_id=current_user.user_id, limit=limit)
 
 
-@router.get("/insights", response_model=ReadingInsightsResponse)
+@router.get(
+    "/insights",
+    response_model=None,
+    responses={200: {"model": ReadingInsightsResponse}},
+)
 async def get_reading_insights(
     current_user: dict = Depends(get_current_user),
     service: RecommendationService = Depends(get_recommendation_service),
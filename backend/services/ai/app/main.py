@@ -1,17 +1,21 @@
+import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from shared.core.config import settings
 from shared.middleware.rate_limit import RateLimitMiddleware
 from .api import router
 
+logger = logging.getLogger(__name__)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    print("AI Service starting...")
+    logger.info("AI Service starting")
     yield
-    print("AI Service shutting down...")
+    logger.info("AI Service shutting down")
 
 
 app = FastAPI(
@@ -19,6 +23,7 @@ app = FastAPI(
     description="AI-powered book recommendations and insights",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if settings.ENVIRONMENT != "production" else None,
 )
 
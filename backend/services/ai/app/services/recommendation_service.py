@@ -1,8 +1,56 @@
-from typing import Optional, List
+from typing import Any, Final, Mapping, Optional, List, Tuple, Union
 from datetime import datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
 import random
 
+import orjson
+
+from fastapi import Response
+
 from shared.core.redis import cache_service
+from ..schemas.ai_schemas import (
+    BookRecommendation,
+    RecommendationListResponse,
+    SimilarBooksResponse,
+)
+
+
+# Placeholder insights are static until the ML analysis lands, so the
+# payload is built and serialized once at import time.
+_STATIC_INSIGHTS: Final[Mapping[str, Any]] = MappingProxyType({
+    "favorite_genres": [
+        {"genre": "소설", "percentage": 40},
+        {"genre": "자기계발", "percentage": 25},
+        {"genre": "역사", "percentage": 20},
+        {"genre": "과학", "percentage": 15},
+    ],
+    "reading_pace": {
+        "pages_per_hour": 30,
+        "books_per_month": 2,
+        "trend": "increasing",
+    },
+    "best_reading_time": "evening",
+    "completion_rate": 0.75,
+    "patterns": [
+        {
+            "pattern_type": "weekly",
+            "description": "주말에 독서량이 평일 대비 2배 높습니다",
+            "data": {"weekday_avg": 30, "weekend_avg": 60},
+        },
+        {
+            "pattern_type": "genre_sequence",
+            "description": "소설 후 자기계발서를 읽는 패턴이 있습니다",
+            "data": {"sequence": ["fiction", "self-help"]},
+        },
+    ],
+    "suggestions": [
+        "아침 독서를 시도해보세요. 집중력이 높은 시간대입니다.",
+        "완독률을 높이려면 한 번에 한 권씩 읽어보세요.",
+        "비슷한 취향의 독서가들이 좋아한 책: '사피엔스'",
+    ],
+})
+_STATIC_INSIGHTS_BYTES: Final[bytes] = orjson.dumps(dict(_STATIC_INSIGHTS))
 
 
 class RecommendationService:
@@ -17,7 +65,15 @@ class RecommendationService:
         "romantic": ["romance", "poetry", "drama"],
     }
 
-    async def get_personalized(self, user_id: str, limit: int) -> dict:
+    # Results below are built from data we generate ourselves, so models are
+    # created with model_construct (no validation) and cached entries are
+    # returned as-is; routes skip response_model re-validation.
+
+    async def get_personalized(
+        self,
+        user_id: str,
+        limit: int,
+    ) -> Union[dict, RecommendationListResponse]:
         """Get personalized recommendations using collaborative filtering"""
         cache_key = f"recommendations:personalized:{user_id}"
         cached = await cache_service.get(cache_key)
@@ -28,11 +84,20 @@ class RecommendationService:
         # For now, return placeholder based on user's reading history
         recommendations = await self._generate_recommendations(user_id, limit)
 
-        result = {"items": recommendations, "total": len(recommendations)}
-        await cache_service.set(cache_key, result, ttl=3600)
+        result = RecommendationListResponse.model_construct(
+            items=recommendations,
+            total=len(recommendations),
+        )
+        await cache_service.set_nx(
+            cache_key, result.model_dump(), ttl=3600, miss_counter="personalized"
+        )
         return result
 
-    async def get_similar_books(self, book_id: str, limit: int) -> dict:
+    async def get_similar_books(
+        self,
+        book_id: str,
+        limit: int,
+    ) -> Union[dict, SimilarBooksResponse]:
         """Find similar books using content-based filtering"""
         cache_key = f"recommendations:similar:{book_id}"
         cached = await cache_service.get(cache_key)
@@ -42,12 +107,14 @@ class RecommendationService:
         # TODO: Implement actual similarity algorithm
         similar = await self._find_similar_books(book_id, limit)
 
-        result = {
-            "source_book_id": book_id,
-            "source_book_title": "Source Book",
-            "similar_books": similar,
-        }
-        await cache_service.set(cache_key, result, ttl=86400)
+        result = SimilarBooksResponse.model_construct(
+            source_book_id=book_id,
+            source_book_title="Source Book",
+            similar_books=similar,
+        )
+        await cache_service.set_nx(
+            cache_key, result.model_dump(), ttl=86400, miss_counter="similar"
+        )
         return result
 
     async def get_trending(
@@ -55,7 +122,7 @@ class RecommendationService:
         period: str,
         genre: Optional[str],
         limit: int,
-    ) -> dict:
+    ) -> Union[dict, RecommendationListResponse]:
         """Get trending books based on reading activity"""
         cache_key = f"recommendations:trending:{period}:{genre or 'all'}"
         cached = await cache_service.get(cache_key)
@@ -65,21 +132,34 @@ class RecommendationService:
         # TODO: Calculate actual trending from reading sessions
         trending = await self._get_trending_books(period, genre, limit)
 
-        result = {"items": trending, "total": len(trending)}
+        result = RecommendationListResponse.model_construct(
+            items=trending,
+            total=len(trending),
+        )
         ttl = {"day": 1800, "week": 3600, "month": 7200}.get(period, 3600)
-        await cache_service.set(cache_key, result, ttl=ttl)
+        await cache_service.set_nx(
+            cache_key, result.model_dump(), ttl=ttl, miss_counter="trending"
+        )
         return result
 
-    async def get_by_mood(self, mood: str, user_id: str, limit: int) -> dict:
+    async def get_by_mood(
+        self,
+        mood: str,
+        user_id: str,
+        limit: int,
+    ) -> RecommendationListResponse:
         """Get recommendations based on mood"""
         genres = self.MOOD_GENRE_MAP.get(mood.lower(), ["fiction"])
 
         # TODO: Combine with user preferences
         recommendations = await self._get_books_by_genres(genres, limit)
 
-        return {"items": recommendations, "total": len(recommendations)}
+        return RecommendationListResponse.model_construct(
+            items=recommendations,
+            total=len(recommendations),
+        )
 
-    async def get_reading_insights(self, user_id: str) -> dict:
+    async def get_reading_insights(self, user_id: str) -> Union[dict, Response]:
         """Generate AI insights about reading patterns"""
         cache_key = f"insights:{user_id}"
         cached = await cache_service.get(cache_key)
@@ -87,41 +167,10 @@ class RecommendationService:
             return cached
 
         # TODO: Implement actual ML analysis
-        insights = {
-            "favorite_genres": [
-                {"genre": "소설", "percentage": 40},
-                {"genre": "자기계발", "percentage": 25},
-                {"genre": "역사", "percentage": 20},
-                {"genre": "과학", "percentage": 15},
-            ],
-            "reading_pace": {
-                "pages_per_hour": 30,
-                "books_per_month": 2,
-                "trend": "increasing",
-            },
-            "best_reading_time": "evening",
-            "completion_rate": 0.75,
-            "patterns": [
-                {
-                    "pattern_type": "weekly",
-                    "description": "주말에 독서량이 평일 대비 2배 높습니다",
-                    "data": {"weekday_avg": 30, "weekend_avg": 60},
-                },
-                {
-                    "pattern_type": "genre_sequence",
-                    "description": "소설 후 자기계발서를 읽는 패턴이 있습니다",
-                    "data": {"sequence": ["fiction", "self-help"]},
-                },
-            ],
-            "suggestions": [
-                "아침 독서를 시도해보세요. 집중력이 높은 시간대입니다.",
-                "완독률을 높이려면 한 번에 한 권씩 읽어보세요.",
-                "비슷한 취향의 독서가들이 좋아한 책: '사피엔스'",
-            ],
-        }
-
-        await cache_service.set(cache_key, insights, ttl=86400)
-        return insights
+        await cache_service.set_nx(
+            cache_key, _STATIC_INSIGHTS_BYTES, ttl=86400, miss_counter="insights"
+        )
+        return Response(content=_STATIC_INSIGHTS_BYTES, media_type="application/json")
 
     async def record_feedback(
         self,
@@ -133,34 +182,34 @@ class RecommendationService:
         # TODO: Store feedback for model training
         pass
 
-    async def _generate_recommendations(self, user_id: str, limit: int) -> List[dict]:
+    async def _generate_recommendations(self, user_id: str, limit: int) -> List[BookRecommendation]:
         """Generate recommendations (placeholder)"""
         return [
-            {
-                "id": f"book_{i}",
-                "title": f"추천 도서 {i}",
-                "authors": ["저자"],
-                "cover_image_url": None,
-                "description": "AI가 추천하는 도서입니다.",
-                "genres": ["fiction"],
-                "match_score": 0.9 - (i * 0.05),
-                "match_reasons": ["독서 이력 기반", "선호 장르 일치"],
-            }
+            BookRecommendation.model_construct(
+                id=f"book_{i}",
+                title=f"추천 도서 {i}",
+                authors=["저자"],
+                cover_image_url=None,
+                description="AI가 추천하는 도서입니다.",
+                genres=["fiction"],
+                match_score=0.9 - (i * 0.05),
+                match_reasons=["독서 이력 기반", "선호 장르 일치"],
+            )
             for i in range(limit)
         ]
 
-    async def _find_similar_books(self, book_id: str, limit: int) -> List[dict]:
+    async def _find_similar_books(self, book_id: str, limit: int) -> List[BookRecommendation]:
         """Find similar books (placeholder)"""
         return [
-            {
-                "id": f"similar_{i}",
-                "title": f"유사 도서 {i}",
-                "authors": ["저자"],
-                "cover_image_url": None,
-                "genres": ["fiction"],
-                "match_score": 0.85 - (i * 0.05),
-                "match_reasons": ["같은 장르", "유사한 주제"],
-            }
+            BookRecommendation.model_construct(
+                id=f"similar_{i}",
+                title=f"유사 도서 {i}",
+                authors=["저자"],
+                cover_image_url=None,
+                genres=["fiction"],
+                match_score=0.85 - (i * 0.05),
+                match_reasons=["같은 장르", "유사한 주제"],
+            )
             for i in range(limit)
         ]
 
@@ -169,32 +218,49 @@ class RecommendationService:
         period: str,
         genre: Optional[str],
         limit: int,
-    ) -> List[dict]:
+    ) -> List[BookRecommendation]:
         """Get trending books (placeholder)"""
-        return [
-            {
-                "id": f"trending_{i}",
-                "title": f"인기 도서 {i}",
-                "authors": ["저자"],
-                "cover_image_url": None,
-                "genres": [genre] if genre else ["fiction"],
-                "match_score": 1.0 - (i * 0.05),
-                "match_reasons": [f"이번 {period} 인기"],
-            }
-            for i in range(limit)
-        ]
+        return list(_trending_payload(period, genre, limit))
 
-    async def _get_books_by_genres(self, genres: List[str], limit: int) -> List[dict]:
+    async def _get_books_by_genres(self, genres: List[str], limit: int) -> List[BookRecommendation]:
         """Get books by genres (placeholder)"""
-        return [
-            {
-                "id": f"mood_{i}",
-                "title": f"분위기 맞춤 도서 {i}",
-                "authors": ["저자"],
-                "cover_image_url": None,
-                "genres": genres,
-                "match_score": 0.8,
-                "match_reasons": ["분위기 맞춤 추천"],
-            }
-            for i in range(limit)
-        ]
+        return list(_mood_payload(tuple(genres), limit))
+
+
+# Placeholder payloads are deterministic in their arguments, so they are
+# memoized per process and skip even the Redis round-trip on repeat calls.
+
+@lru_cache(maxsize=1024)
+def _trending_payload(
+    period: str,
+    genre: Optional[str],
+    limit: int,
+) -> Tuple[BookRecommendation, ...]:
+    return tuple(
+        BookRecommendation.model_construct(
+            id=f"trending_{i}",
+            title=f"인기 도서 {i}",
+            authors=["저자"],
+            cover_image_url=None,
+            genres=[genre] if genre else ["fiction"],
+            match_score=1.0 - (i * 0.05),
+            match_reasons=[f"이번 {period} 인기"],
+        )
+        for i in range(limit)
+    )
+
+
+@lru_cache(maxsize=1024)
+def _mood_payload(genres: Tuple[str, ...], limit: int) -> Tuple[BookRecommendation, ...]:
+    return tuple(
+        BookRecommendation.model_construct(
+            id=f"mood_{i}",
+            title=f"분위기 맞춤 도서 {i}",
+            authors=["저자"],
+            cover_image_url=None,
+            genres=list(genres),
+            match_score=0.8,
+            match_reasons=["분위기 맞춤 추천"],
+        )
+        for i in range(limit)
+    )
@@ -1,26 +1,33 @@
 """Auth Service main application."""
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from shared.core.config import settings
-from shared.core.database import close_db, init_db
-from shared.core.redis import close_redis
+from shared.core.database import close_db, init_db, warmup_db_pool
+from shared.core.redis import close_redis, init_redis
+from shared.core.security import close_hash_executor, get_hash_executor
 from shared.middleware.rate_limit import RateLimitMiddleware
 
 from .api import router
+from .services.auth_service import warm_nickname_filter
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
     # Startup
-    await init_db()
+    await asyncio.gather(init_db(), init_redis())
+    await warmup_db_pool(settings.DB_POOL_WARMUP)
+    get_hash_executor()
+    await warm_nickname_filter()
     yield
     # Shutdown
-    await close_db()
-    await close_redis()
+    await asyncio.gather(close_db(), close_redis())
+    close_hash_executor()
 
 
 app = FastAPI(
@@ -28,6 +35,7 @@ app = FastAPI(
     description="Authentication and authorization service for ReadLock",
     version=settings.APP_VERSION,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
 )
@@ -3,10 +3,11 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
+from uuid6 import uuid7
 
 from shared.core.database import Base
 
@@ -14,11 +15,21 @@ from shared.core.database import Base
 class User(Base):
     """User model."""
     __tablename__ = "users"
+    # Fetch server-generated timestamps via RETURNING instead of a refresh
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index("idx_users_provider", "provider", "provider_id"),
+        Index(
+            "ix_users_last_login_at",
+            "last_login_at",
+            postgresql_where=text("last_login_at IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
         primary_key=True,
-        server_default=func.uuid_generate_v4(),
+        default=uuid7,
     )
     email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
     password_hash: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
@@ -54,11 +65,19 @@ class User(Base):
 class UserProfile(Base):
     """User profile model."""
     __tablename__ = "user_profiles"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index(
+            "ix_user_profiles_premium_until",
+            "premium_until",
+            postgresql_where=text("premium_until IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
         primary_key=True,
-        server_default=func.uuid_generate_v4(),
+        default=uuid7,
     )
     user_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
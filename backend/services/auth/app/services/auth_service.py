@@ -1,21 +1,49 @@
 """Auth service implementation."""
+import hashlib
+import time
+from collections import OrderedDict
 from datetime import datetime
 from typing import Any, Optional
 from uuid import UUID
 
-from sqlalchemy import select
+import orjson
+from sqlalchemy import exists, func, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
+from shared.core.database import get_db_session
+from shared.core.redis import nickname_filter
 from shared.core.security import (
+    TokenPair,
     create_token_pair,
-    get_password_hash,
-    verify_password,
+    get_password_hash_async,
+    verify_password_async,
     verify_token,
 )
 
 from ..models.user import User, UserProfile
 
+# User columns the login paths read or serialize; the profile is loaded in
+# full because _serialize_user returns every profile field
+_LOGIN_USER_COLUMNS = (
+    User.id,
+    User.email,
+    User.password_hash,
+    User.provider,
+    User.provider_id,
+    User.status,
+    User.last_login_at,
+    User.created_at,
+)
+
+OAUTH_TOKEN_CACHE_SIZE = 4096
+OAUTH_TOKEN_CACHE_TTL = 300
+
+# Recently decoded OAuth id tokens: blake2b(token) -> (cache expiry, claims)
+_oauth_token_cache: "OrderedDict[bytes, tuple[float, dict[str, Any]]]" = OrderedDict()
+
 
 class AuthService:
     """Authentication service."""
@@ -30,24 +58,21 @@ class AuthService:
         nickname: str,
     ) -> Optional[dict[str, Any]]:
         """Register a new user."""
-        # Check if email exists
+        # Check email and nickname availability in one round-trip
         existing = await self.db.execute(
-            select(User).where(User.email == email)
-        )
-        if existing.scalar_one_or_none():
-            return None
-
-        # Check if nickname exists
-        existing_profile = await self.db.execute(
-            select(UserProfile).where(UserProfile.nickname == nickname)
+            select(
+                exists().where(User.email == email).label("email_taken"),
+                exists().where(UserProfile.nickname == nickname).label("nickname_taken"),
+            )
         )
-        if existing_profile.scalar_one_or_none():
+        email_taken, nickname_taken = existing.one()
+        if email_taken or nickname_taken:
             return None
 
         # Create user
         user = User(
             email=email,
-            password_hash=get_password_hash(password),
+            password_hash=await get_password_hash_async(password),
             provider="local",
         )
         self.db.add(user)
@@ -60,10 +85,7 @@ class AuthService:
         )
         self.db.add(profile)
         await self.db.commit()
-
-        # Refresh to get all data
-        await self.db.refresh(user)
-        await self.db.refresh(profile)
+        await nickname_filter.add(nickname)
 
         # Generate tokens
         tokens = create_token_pair(user.id, user.email)
@@ -82,7 +104,7 @@ class AuthService:
         # Find user
         result = await self.db.execute(
             select(User)
-            .options(selectinload(User.profile))
+            .options(load_only(*_LOGIN_USER_COLUMNS), selectinload(User.profile))
             .where(User.email == email)
         )
         user = result.scalar_one_or_none()
@@ -90,17 +112,25 @@ class AuthService:
         if user is None:
             return None
 
-        if user.password_hash is None:
+        # Cheap checks first so inactive accounts never cost a password hash
+        if user.status != "active":
             return None
 
-        if not verify_password(password, user.password_hash):
+        if user.password_hash is None:
             return None
 
-        if user.status != "active":
+        if not await verify_password_async(password, user.password_hash):
             return None
 
-        # Update last login
-        user.last_login_at = datetime.utcnow()
+        # Update last login without a unit-of-work flush
+        result = await self.db.execute(
+            update(User)
+            .where(User.id == user.id)
+            .values(last_login_at=func.now())
+            .returning(User.last_login_at)
+            .execution_options(synchronize_session=False)
+        )
+        set_committed_value(user, "last_login_at", result.scalar_one())
         await self.db.commit()
 
         # Generate tokens
@@ -126,16 +156,23 @@ class AuthService:
         email = oauth_data.get("email")
         provider_id = oauth_data.get("sub") or oauth_data.get("id")
 
-        # Find existing user
-        result = await self.db.execute(
-            select(User)
-            .options(selectinload(User.profile))
-            .where(
-                (User.email == email) |
-                ((User.provider == provider) & (User.provider_id == provider_id))
-            )
+        # Find existing user: by email first (returning users), then by
+        # provider identity, so each lookup is a single index probe
+        user_query = select(User).options(
+            load_only(*_LOGIN_USER_COLUMNS), selectinload(User.profile)
         )
-        user = result.scalar_one_or_none()
+        user = None
+        if email:
+            result = await self.db.execute(user_query.where(User.email == email))
+            user = result.scalar_one_or_none()
+        if user is None:
+            result = await self.db.execute(
+                user_query.where(
+                    User.provider == provider,
+                    User.provider_id == provider_id,
+                )
+            )
+            user = result.scalar_one_or_none()
 
         is_new_user = False
 
@@ -151,16 +188,23 @@ class AuthService:
             await self.db.flush()
 
             # Create profile
-            nickname = await self._generate_unique_nickname(email.split("@")[0])
+            base_nickname = email.split("@")[0]
             profile = UserProfile(
                 user_id=user.id,
-                nickname=nickname,
+                nickname=await self._generate_unique_nickname(base_nickname),
                 profile_image=oauth_data.get("picture"),
             )
-            self.db.add(profile)
+            try:
+                async with self.db.begin_nested():
+                    self.db.add(profile)
+            except IntegrityError:
+                # The filter missed a taken nickname; ask the database instead
+                profile.nickname = await self._generate_unique_nickname(
+                    base_nickname, use_filter=False
+                )
+                self.db.add(profile)
             await self.db.commit()
-            await self.db.refresh(user)
-            await self.db.refresh(profile)
+            await nickname_filter.add(profile.nickname)
             user.profile = profile
         else:
             # Update provider info if needed
@@ -189,11 +233,12 @@ class AuthService:
         if token_data is None:
             return None
 
+        uid = self._parse_uuid(token_data.user_id)
+        if uid is None:
+            return None
+
         # Verify user exists
-        result = await self.db.execute(
-            select(User).where(User.id == UUID(token_data.user_id))
-        )
-        user = result.scalar_one_or_none()
+        user = await self.db.get(User, uid)
 
         if user is None or user.status != "active":
             return None
@@ -205,10 +250,8 @@ class AuthService:
 
     async def logout(self, user_id: str) -> None:
         """Logout user (invalidate FCM token)."""
-        result = await self.db.execute(
-            select(User).where(User.id == UUID(user_id))
-        )
-        user = result.scalar_one_or_none()
+        uid = self._parse_uuid(user_id)
+        user = await self.db.get(User, uid) if uid else None
 
         if user:
             user.fcm_token = None
@@ -221,10 +264,8 @@ class AuthService:
         platform: str,
     ) -> None:
         """Update FCM token for push notifications."""
-        result = await self.db.execute(
-            select(User).where(User.id == UUID(user_id))
-        )
-        user = result.scalar_one_or_none()
+        uid = self._parse_uuid(user_id)
+        user = await self.db.get(User, uid) if uid else None
 
         if user:
             user.fcm_token = fcm_token
@@ -232,12 +273,11 @@ class AuthService:
 
     async def get_user_by_id(self, user_id: str) -> Optional[dict[str, Any]]:
         """Get user by ID."""
-        result = await self.db.execute(
-            select(User)
-            .options(selectinload(User.profile))
-            .where(User.id == UUID(user_id))
-        )
-        user = result.scalar_one_or_none()
+        uid = self._parse_uuid(user_id)
+        if uid is None:
+            return None
+
+        user = await self.db.get(User, uid, options=[selectinload(User.profile)])
 
         if user is None:
             return None
@@ -255,52 +295,75 @@ class AuthService:
 
         # For now, decode JWT without verification (UNSAFE - for development only)
         import base64
-        import json
+
+        token = id_token.encode()
+        key = hashlib.blake2b(token, digest_size=16).digest()
+        cached = _oauth_token_cache.get(key)
+        if cached is not None:
+            expires_at, claims = cached
+            if expires_at > time.monotonic():
+                return claims
+            del _oauth_token_cache[key]
 
         try:
-            parts = id_token.split(".")
+            parts = token.split(b".")
             if len(parts) != 3:
                 return None
 
             payload = parts[1]
             # Add padding if needed
-            payload += "=" * (4 - len(payload) % 4)
-            decoded = base64.urlsafe_b64decode(payload)
-            return json.loads(decoded)
+            decoded = base64.urlsafe_b64decode(payload + b"==="[:-len(payload) & 3])
+            claims = orjson.loads(decoded)
         except Exception:
             return None
 
-    async def _generate_unique_nickname(self, base: str) -> str:
+        _oauth_token_cache[key] = (time.monotonic() + OAUTH_TOKEN_CACHE_TTL, claims)
+        if len(_oauth_token_cache) > OAUTH_TOKEN_CACHE_SIZE:
+            _oauth_token_cache.popitem(last=False)
+
+        return claims
+
+    async def _generate_unique_nickname(self, base: str, use_filter: bool = True) -> str:
         """Generate a unique nickname."""
         import random
         import string
 
         nickname = base[:15]  # Max 20 chars, leave room for suffix
 
-        # Check if exists
-        result = await self.db.execute(
-            select(UserProfile).where(UserProfile.nickname == nickname)
-        )
-
-        if result.scalar_one_or_none() is None:
-            return nickname
+        candidates = [nickname] + [
+            f"{nickname}_{''.join(random.choices(string.digits, k=4))}"
+            for _ in range(10)
+        ]
 
-        # Add random suffix
-        for _ in range(10):
-            suffix = "".join(random.choices(string.digits, k=4))
-            new_nickname = f"{nickname}_{suffix}"
+        # A filter miss means the nickname was never taken, so skip SQL
+        if use_filter and await nickname_filter.is_ready():
+            maybe_taken = await nickname_filter.might_contain(candidates)
+            for candidate, taken in zip(candidates, maybe_taken):
+                if not taken:
+                    return candidate
 
-            result = await self.db.execute(
-                select(UserProfile).where(UserProfile.nickname == new_nickname)
-            )
+        # Probe the base name and random suffixes in a single query
+        result = await self.db.execute(
+            select(UserProfile.nickname).where(UserProfile.nickname.in_(candidates))
+        )
+        taken = set(result.scalars().all())
 
-            if result.scalar_one_or_none() is None:
-                return new_nickname
+        for candidate in candidates:
+            if candidate not in taken:
+                return candidate
 
         # Fallback to timestamp
         import time
         return f"{nickname}_{int(time.time())}"
 
+    @staticmethod
+    def _parse_uuid(value: str) -> Optional[UUID]:
+        """Parse a UUID string, returning None if it is malformed."""
+        try:
+            return UUID(value)
+        except (TypeError, ValueError):
+            return None
+
     def _serialize_user(self, user: User, profile: UserProfile) -> dict:
         """Serialize user for response."""
         return {
@@ -326,7 +389,7 @@ class AuthService:
             },
         }
 
-    def _serialize_tokens(self, tokens) -> dict:
+    def _serialize_tokens(self, tokens: TokenPair) -> dict:
         """Serialize tokens for response."""
         return {
             "accessToken": tokens.access_token,
@@ -334,3 +397,18 @@ class AuthService:
             "expiresIn": tokens.expires_in,
             "tokenType": tokens.token_type,
         }
+
+
+async def warm_nickname_filter() -> None:
+    """Load existing nicknames into the nickname filter once."""
+    if await nickname_filter.is_ready():
+        return
+
+    async with get_db_session() as session:
+        result = await session.stream_scalars(
+            select(UserProfile.nickname).execution_options(yield_per=10000)
+        )
+        async for nicknames in result.partitions():
+            await nickname_filter.add(*nicknames)
+
+    await nickname_filter.mark_ready()
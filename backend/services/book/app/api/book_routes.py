@@ -1,5 +1,7 @@
-from fastapi import APIRouter, Depends, Query, HTTPException, status
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, status
+from functools import lru_cache
 from typing import Optional
+from uuid import UUID
 
 from shared.middleware.auth import get_current_user
 from ..schemas.book_schemas import (
@@ -16,12 +18,14 @@ from ..services.naver_book_service import NaverBookService
 router = APIRouter()
 
 
+@lru_cache(maxsize=1)
 def get_book_service() -> BookService:
     return BookService()
 
 
-def get_naver_service() -> NaverBookService:
-    return NaverBookService()
+def get_naver_service(request: Request) -> NaverBookService:
+    # Created once in the app lifespan so its HTTP client pool is shared
+    return request.app.state.naver
 
 
 @router.get("/search", response_model=BookSearchResponse)
@@ -93,18 +97,25 @@ async def get_user_books(
     status: Optional[str] = Query(None),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
     current_user: dict = Depends(get_current_user),
     book_service: BookService = Depends(get_book_service),
 ):
     """
     Get current user's book library
+    Pass next_cursor from the previous page to seek instead of paging by offset
     """
-    user_books = await book_service.get_user_books(
-        user_id=current_user.user_id,
-        status=status,
-        page=page,
-        page_size=page_size,
-    )
+    try:
+        user_books = await book_service.get_user_books(
+            user_id=current_user.user_id,
+            status=status,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+        )
+    except ValueError:
+        # `status` is shadowed by the query parameter here
+        raise HTTPException(status_code=400, detail="Invalid cursor")
     return user_books
 
 
@@ -117,6 +128,11 @@ async def add_book_to_library(
     """
     Add a book to user's library
     """
+    try:
+        UUID(data.book_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid book id")
+
     user_book = await book_service.add_to_library(
         user_id=current_user.user_id,
         book_id=data.book_id,
@@ -239,14 +255,8 @@ async def seed_sample_books(
         },
     ]
 
-    created_books = []
-    for book_data in sample_books:
-        try:
-            book = await book_service.create_book(book_data)
-            created_books.append(book)
-        except Exception as e:
-            # Book might already exist
-            pass
+    # Books that already exist are skipped
+    created_books = await book_service.bulk_create_books(sample_books)
 
     return {
         "message": f"Created {len(created_books)} sample books",
@@ -1,10 +1,12 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from shared.core.config import settings
 from shared.middleware.rate_limit import RateLimitMiddleware
 from .api import router
+from .services.naver_book_service import NaverBookService
 
 
 @asynccontextmanager
@@ -12,9 +14,11 @@ async def lifespan(app: FastAPI):
     """Application lifespan handler"""
     # Startup
     print("Book Service starting...")
+    app.state.naver = NaverBookService()
     yield
     # Shutdown
     print("Book Service shutting down...")
+    await app.state.naver.close()
 
 
 app = FastAPI(
@@ -22,6 +26,7 @@ app = FastAPI(
     description="Book search and management service",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if settings.ENVIRONMENT != "production" else None,
     redoc_url="/redoc" if settings.ENVIRONMENT != "production" else None,
 )
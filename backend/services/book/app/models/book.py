@@ -1,8 +1,8 @@
-from datetime import datetime
 from typing import Optional, List
-from sqlalchemy import Column, String, Integer, Float, Text, DateTime, ForeignKey, Date
+from sqlalchemy import Column, String, Integer, Float, Text, DateTime, ForeignKey, Date, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func, text
 import uuid
 
 from shared.core.database import Base
@@ -11,6 +11,8 @@ from shared.core.database import Base
 class Book(Base):
     """Book model"""
     __tablename__ = "books"
+    # Fetch server-generated timestamps via RETURNING instead of a refresh
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     isbn = Column(String(20), unique=True, index=True, nullable=True)
@@ -25,10 +27,11 @@ class Book(Base):
     naver_link = Column(String(500), nullable=True)
 
     # Metadata
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
-    user_books = relationship("UserBook", back_populates="book")
+    # Never needed when rendering a book, so fail loudly instead of lazy loading
+    user_books = relationship("UserBook", back_populates="book", lazy="raise")
 
     def to_dict(self) -> dict:
         return {
@@ -50,6 +53,16 @@ class Book(Base):
 class UserBook(Base):
     """User's book in their library"""
     __tablename__ = "user_books"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        UniqueConstraint("user_id", "book_id", name="uq_user_book"),
+        # Keyset pagination over a user's library, with and without status
+        Index("ix_user_books_user_updated", "user_id", text("updated_at DESC"), text("id DESC")),
+        Index(
+            "ix_user_books_user_status_updated",
+            "user_id", "status", text("updated_at DESC"), text("id DESC"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
@@ -62,11 +75,11 @@ class UserBook(Base):
     started_at = Column(DateTime, nullable=True)
     finished_at = Column(DateTime, nullable=True)
 
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
-    book = relationship("Book", back_populates="user_books")
+    book = relationship("Book", back_populates="user_books", lazy="selectin")
 
     def to_dict(self) -> dict:
         return {
@@ -1,8 +1,11 @@
-from typing import Optional, List
+from typing import Optional, List, Literal
 from datetime import datetime, date
 from pydantic import BaseModel, Field
 
 
+UserBookStatus = Literal["wishlist", "reading", "completed", "dropped"]
+
+
 class BookResponse(BaseModel):
     """Book response schema"""
     id: str
@@ -47,12 +50,12 @@ class BookSearchResponse(BaseModel):
 class UserBookCreate(BaseModel):
     """Create user book request"""
     book_id: str
-    status: str = Field(default="wishlist", pattern="^(wishlist|reading|completed|dropped)$")
+    status: UserBookStatus = "wishlist"
 
 
 class UserBookUpdate(BaseModel):
     """Update user book request"""
-    status: Optional[str] = Field(None, pattern="^(wishlist|reading|completed|dropped)$")
+    status: Optional[UserBookStatus] = None
     current_page: Optional[int] = Field(None, ge=0)
     total_pages: Optional[int] = Field(None, ge=0)
 
@@ -78,7 +81,8 @@ class UserBookResponse(BaseModel):
 class UserBooksListResponse(BaseModel):
     """User books list response"""
     items: List[UserBookResponse]
-    total: int
+    total: Optional[int] = None  # Not counted; use has_more
     page: int
     page_size: int
     has_more: bool
+    next_cursor: Optional[str] = None
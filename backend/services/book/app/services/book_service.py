@@ -1,8 +1,10 @@
-from typing import Optional, List
-from uuid import uuid4
+from typing import Optional, List, Tuple, Union
+from uuid import UUID, uuid4
 from datetime import datetime
+import base64
 
-from sqlalchemy import select, and_
+from sqlalchemy import Integer, bindparam, column, select, table, text, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from shared.core.database import get_db_session
@@ -10,82 +12,190 @@ from ..models.book import Book, UserBook
 from ..schemas.book_schemas import UserBookUpdate
 
 
+def _as_uuid(value: str) -> Optional[UUID]:
+    """Parse a UUID string, returning None if it is malformed"""
+    try:
+        return UUID(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_uuid(value: Union[str, UUID]) -> UUID:
+    """Coerce an id to a native UUID so it binds as 16-byte binary"""
+    return UUID(value) if isinstance(value, str) else value
+
+
+def _encode_cursor(user_book: UserBook) -> str:
+    """Encode the (updated_at, id) seek position of a row"""
+    raw = f"{user_book.updated_at.isoformat()}|{user_book.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode a cursor produced by _encode_cursor"""
+    updated_at, user_book_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+    return datetime.fromisoformat(updated_at), UUID(user_book_id)
+
+
+def _user_books_stmt(by_status: bool, by_cursor: bool):
+    """Build a user library page statement with bound parameters"""
+    stmt = select(UserBook).where(UserBook.user_id == bindparam("user_id"))
+    if by_status:
+        stmt = stmt.where(UserBook.status == bindparam("status"))
+    if by_cursor:
+        # Seek past the last row seen instead of scanning an offset
+        stmt = stmt.where(
+            tuple_(UserBook.updated_at, UserBook.id)
+            < tuple_(
+                bindparam("cur_updated_at", type_=UserBook.updated_at.type),
+                bindparam("cur_id", type_=UserBook.id.type),
+            )
+        )
+    else:
+        stmt = stmt.offset(bindparam("offset", type_=Integer))
+    return stmt.order_by(UserBook.updated_at.desc(), UserBook.id.desc()).limit(
+        bindparam("limit", type_=Integer)
+    )
+
+
+# Statements built once at import; calls only bind parameter values
+_BOOK_BY_ISBN = select(Book).where(Book.isbn == bindparam("isbn"))
+_USER_BOOKS_STMTS = {
+    (by_status, by_cursor): _user_books_stmt(by_status, by_cursor)
+    for by_status in (False, True)
+    for by_cursor in (False, True)
+}
+
+
 class BookService:
     """Service for book operations"""
 
+    # Batches at least this large are loaded with COPY instead of INSERT
+    COPY_THRESHOLD = 100
+    BOOK_COLUMNS = [
+        "id", "isbn", "title", "author", "publisher", "published_date",
+        "description", "cover_image", "category", "page_count", "naver_link",
+    ]
+
     async def get_by_id(self, book_id: str) -> Optional[dict]:
         """Get book by ID"""
         async with get_db_session() as session:
-            result = await session.execute(
-                select(Book).where(Book.id == book_id)
-            )
-            book = result.scalar_one_or_none()
+            book_uuid = _as_uuid(book_id)
+            book = await session.get(Book, book_uuid) if book_uuid else None
             return book.to_dict() if book else None
 
     async def get_by_isbn(self, isbn: str) -> Optional[dict]:
         """Get book by ISBN"""
         clean_isbn = isbn.replace("-", "")
         async with get_db_session() as session:
-            result = await session.execute(
-                select(Book).where(Book.isbn == clean_isbn)
-            )
+            result = await session.execute(_BOOK_BY_ISBN, {"isbn": clean_isbn})
             book = result.scalar_one_or_none()
             return book.to_dict() if book else None
 
     async def create_book(self, book_data: dict) -> dict:
         """Create a new book record"""
         async with get_db_session() as session:
-            book = Book(
-                id=str(uuid4()),
-                isbn=book_data.get("isbn"),
-                title=book_data["title"],
-                author=book_data.get("author") or ", ".join(book_data.get("authors", [])),
-                publisher=book_data.get("publisher"),
-                published_date=book_data.get("published_date"),
-                description=book_data.get("description"),
-                cover_image=book_data.get("cover_image") or book_data.get("cover_image_url"),
-                category=book_data.get("category"),
-                page_count=book_data.get("page_count"),
-                naver_link=book_data.get("naver_link") or book_data.get("link"),
-            )
+            book = Book(**self._book_row(book_data))
             session.add(book)
             await session.commit()
-            await session.refresh(book)
             return book.to_dict()
 
+    async def bulk_create_books(self, books_data: List[dict]) -> List[dict]:
+        """Create many book records in one transaction, skipping known ISBNs"""
+        rows = [self._book_row(book_data) for book_data in books_data]
+        if not rows:
+            return []
+
+        async with get_db_session() as session:
+            if len(rows) >= self.COPY_THRESHOLD:
+                # COPY has no conflict handling, so stage the rows and insert
+                # from the staging table with the same conflict rule
+                staging = table("books_staging", *map(column, self.BOOK_COLUMNS))
+                await session.execute(text(
+                    f"CREATE TEMP TABLE {staging.name} "
+                    f"(LIKE {Book.__tablename__} INCLUDING DEFAULTS) ON COMMIT DROP"
+                ))
+                conn = await session.connection()
+                raw_conn = await conn.get_raw_connection()
+                await raw_conn.driver_connection.copy_records_to_table(
+                    staging.name,
+                    records=[tuple(row[c] for c in self.BOOK_COLUMNS) for row in rows],
+                    columns=self.BOOK_COLUMNS,
+                )
+                insert_stmt = pg_insert(Book).from_select(
+                    self.BOOK_COLUMNS, select(*staging.c)
+                )
+            else:
+                insert_stmt = pg_insert(Book).values(rows)
+
+            result = await session.scalars(
+                insert_stmt
+                .on_conflict_do_nothing(index_elements=[Book.isbn])
+                .returning(Book)
+            )
+            return [book.to_dict() for book in result.all()]
+
+    @staticmethod
+    async def _get_owned_user_book(session, user_id: str, user_book_id: str) -> Optional[UserBook]:
+        """Load a user book by primary key if it belongs to the user"""
+        user_book_uuid = _as_uuid(user_book_id)
+        if user_book_uuid is None:
+            return None
+        user_book = await session.get(UserBook, user_book_uuid)
+        if user_book is None or user_book.user_id != _to_uuid(user_id):
+            return None
+        return user_book
+
+    @staticmethod
+    def _book_row(book_data: dict) -> dict:
+        """Map incoming book data onto book columns"""
+        return {
+            "id": uuid4(),
+            "isbn": book_data.get("isbn"),
+            "title": book_data["title"],
+            "author": book_data.get("author") or ", ".join(book_data.get("authors", [])),
+            "publisher": book_data.get("publisher"),
+            "published_date": book_data.get("published_date"),
+            "description": book_data.get("description"),
+            "cover_image": book_data.get("cover_image") or book_data.get("cover_image_url"),
+            "category": book_data.get("category"),
+            "page_count": book_data.get("page_count"),
+            "naver_link": book_data.get("naver_link") or book_data.get("link"),
+        }
+
     async def get_user_books(
         self,
         user_id: str,
         status: Optional[str] = None,
         page: int = 1,
         page_size: int = 20,
+        cursor: Optional[str] = None,
     ) -> dict:
         """Get user's book library"""
         async with get_db_session() as session:
-            query = select(UserBook).where(UserBook.user_id == user_id)
-
+            # One extra row tells whether another page exists without a COUNT
+            params = {"user_id": _to_uuid(user_id), "limit": page_size + 1}
             if status:
-                query = query.where(UserBook.status == status)
-
-            # Count total
-            count_result = await session.execute(
-                select(UserBook.id).where(UserBook.user_id == user_id)
-            )
-            total = len(count_result.all())
+                params["status"] = status
+            if cursor:
+                params["cur_updated_at"], params["cur_id"] = _decode_cursor(cursor)
+            else:
+                params["offset"] = (page - 1) * page_size
 
-            # Paginate
-            query = query.order_by(UserBook.updated_at.desc())
-            query = query.offset((page - 1) * page_size).limit(page_size)
-
-            result = await session.execute(query)
-            user_books = result.scalars().all()
+            query = _USER_BOOKS_STMTS[bool(status), bool(cursor)]
+            user_books = (await session.execute(query, params)).scalars().all()
+            has_more = len(user_books) > page_size
+            user_books = user_books[:page_size]
 
             return {
                 "items": [ub.to_dict() for ub in user_books],
-                "total": total,
+                "total": None,
                 "page": page,
                 "page_size": page_size,
-                "has_more": page * page_size < total,
+                "has_more": has_more,
+                "next_cursor": (
+                    _encode_cursor(user_books[-1]) if has_more and user_books else None
+                ),
             }
 
     async def add_to_library(
@@ -96,31 +206,64 @@ class BookService:
     ) -> dict:
         """Add a book to user's library"""
         async with get_db_session() as session:
-            # Check if already exists
-            existing = await session.execute(
-                select(UserBook).where(
-                    and_(
-                        UserBook.user_id == user_id,
-                        UserBook.book_id == book_id,
-                    )
+            # Insert unless (user_id, book_id) already exists, in one round-trip
+            result = await session.scalars(
+                pg_insert(UserBook)
+                .values(
+                    id=uuid4(),
+                    user_id=_to_uuid(user_id),
+                    book_id=_to_uuid(book_id),
+                    status=status,
+                    current_page=0,
+                    started_at=datetime.utcnow() if status == "reading" else None,
                 )
+                .on_conflict_do_nothing(index_elements=["user_id", "book_id"])
+                .returning(UserBook)
             )
-            if existing.scalar_one_or_none():
+            user_book = result.one_or_none()
+            if user_book is None:
                 raise ValueError("Book already in library")
 
-            user_book = UserBook(
-                id=str(uuid4()),
-                user_id=user_id,
-                book_id=book_id,
-                status=status,
-                current_page=0,
-                started_at=datetime.utcnow() if status == "reading" else None,
-            )
-            session.add(user_book)
             await session.commit()
-            await session.refresh(user_book)
             return user_book.to_dict()
 
+    async def add_many_to_library(
+        self,
+        user_id: str,
+        book_ids: List[str],
+        status: str = "wishlist",
+    ) -> List[dict]:
+        """Add several books to user's library, skipping ones already there"""
+        if not book_ids:
+            return []
+
+        user_uuid = _to_uuid(user_id)
+        started_at = datetime.utcnow() if status == "reading" else None
+        rows = [
+            {
+                "id": uuid4(),
+                "user_id": user_uuid,
+                "book_id": book_id,
+                "status": status,
+                "current_page": 0,
+                "started_at": started_at,
+            }
+            for book_id in dict.fromkeys(map(_to_uuid, book_ids))
+        ]
+
+        async with get_db_session() as session:
+            # One multi-row INSERT and one commit for the whole batch
+            result = await session.scalars(
+                pg_insert(UserBook)
+                .values(rows)
+                .on_conflict_do_nothing(index_elements=["user_id", "book_id"])
+                .returning(UserBook)
+            )
+            user_books = result.all()
+
+            await session.commit()
+            return [ub.to_dict() for ub in user_books]
+
     async def update_user_book(
         self,
         user_id: str,
@@ -129,15 +272,7 @@ class BookService:
     ) -> Optional[dict]:
         """Update a user's book"""
         async with get_db_session() as session:
-            result = await session.execute(
-                select(UserBook).where(
-                    and_(
-                        UserBook.id == user_book_id,
-                        UserBook.user_id == user_id,
-                    )
-                )
-            )
-            user_book = result.scalar_one_or_none()
+            user_book = await self._get_owned_user_book(session, user_id, user_book_id)
             if not user_book:
                 return None
 
@@ -158,10 +293,7 @@ class BookService:
             if data.total_pages is not None:
                 user_book.total_pages = data.total_pages
 
-            user_book.updated_at = datetime.utcnow()
-
             await session.commit()
-            await session.refresh(user_book)
             return user_book.to_dict()
 
     async def remove_from_library(
@@ -171,15 +303,7 @@ class BookService:
     ) -> bool:
         """Remove a book from user's library"""
         async with get_db_session() as session:
-            result = await session.execute(
-                select(UserBook).where(
-                    and_(
-                        UserBook.id == user_book_id,
-                        UserBook.user_id == user_id,
-                    )
-                )
-            )
-            user_book = result.scalar_one_or_none()
+            user_book = await self._get_owned_user_book(session, user_id, user_book_id)
             if not user_book:
                 return False
 
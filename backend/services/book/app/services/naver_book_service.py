@@ -1,3 +1,5 @@
+import asyncio
+import re
 import httpx
 from typing import Optional, List
 from pydantic import BaseModel
@@ -5,6 +7,15 @@ from pydantic import BaseModel
 from shared.core.config import settings
 from shared.core.redis import cache_service
 
+# Naver wraps matched search terms in <b> tags
+_BOLD_TAG_RE = re.compile(r"</?b>")
+_PUBDATE_RE = re.compile(r"^(\d{4})(\d{2})?(\d{2})?")
+
+# Cached in place of a book when Naver has no match for an ISBN
+_ISBN_MISS = {"__miss__": True}
+ISBN_MISS_TTL = 300
+EMPTY_SEARCH_TTL = 60
+
 
 class NaverBookItem(BaseModel):
     """Book item from Naver API"""
@@ -37,19 +48,16 @@ class NaverBookService:
     def __init__(self):
         self.client_id = settings.NAVER_CLIENT_ID
         self.client_secret = settings.NAVER_CLIENT_SECRET
-        self._client: Optional[httpx.AsyncClient] = None
-
-    @property
-    def headers(self) -> dict:
-        return {
-            "X-Naver-Client-Id": self.client_id,
-            "X-Naver-Client-Secret": self.client_secret,
-        }
-
-    async def _get_client(self) -> httpx.AsyncClient:
-        if self._client is None:
-            self._client = httpx.AsyncClient(timeout=10.0)
-        return self._client
+        # One long-lived pooled client so requests reuse open connections
+        self._client = httpx.AsyncClient(
+            timeout=10.0,
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            headers=httpx.Headers({
+                "X-Naver-Client-Id": self.client_id,
+                "X-Naver-Client-Secret": self.client_secret,
+            }),
+        )
 
     async def search_books(
         self,
@@ -74,15 +82,12 @@ class NaverBookService:
         if cached:
             return cached
 
-        client = await self._get_client()
-
         # Naver API uses 'start' (1-indexed) instead of page
         start = (page - 1) * page_size + 1
 
         try:
-            response = await client.get(
+            response = await self._client.get(
                 self.SEARCH_URL,
-                headers=self.headers,
                 params={
                     "query": query,
                     "display": min(page_size, 100),
@@ -101,8 +106,10 @@ class NaverBookService:
                 "has_more": start + page_size <= min(data.get("total", 0), 1000),
             }
 
-            # Cache for 1 hour
-            await cache_service.set(cache_key, result, ttl=3600)
+            # Cache for 1 hour, empty results only briefly
+            await cache_service.set(
+                cache_key, result, ttl=3600 if result["items"] else EMPTY_SEARCH_TTL
+            )
 
             return result
 
@@ -131,39 +138,95 @@ class NaverBookService:
         cache_key = f"book_isbn:{isbn}"
         cached = await cache_service.get(cache_key)
         if cached:
-            return cached
+            return None if cached.get("__miss__") else cached
 
-        client = await self._get_client()
+        try:
+            book = await self._fetch_book_by_isbn(isbn)
+        except httpx.HTTPError as e:
+            print(f"Naver API error: {e}")
+            return None
 
-        # Clean ISBN (remove hyphens)
-        clean_isbn = isbn.replace("-", "")
+        if book:
+            # Cache for 24 hours
+            await cache_service.set(cache_key, book, ttl=86400)
+        else:
+            # Remember unknown ISBNs so repeated scans skip the upstream call
+            await cache_service.set(cache_key, _ISBN_MISS, ttl=ISBN_MISS_TTL)
 
-        try:
-            response = await client.get(
-                self.DETAIL_URL,
-                headers=self.headers,
-                params={
-                    "d_isbn": clean_isbn,
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
+        return book
 
-            items = data.get("items", [])
-            if not items:
-                return None
+    async def get_books_by_isbns(self, isbns: List[str]) -> List[Optional[dict]]:
+        """
+        Get book details for many ISBNs concurrently
 
-            book = self._transform_book(items[0])
+        Args:
+            isbns: ISBN-10 or ISBN-13 values
 
+        Returns:
+            Book dictionaries (or None if not found) in input order
+        """
+        cache_keys = [f"book_isbn:{isbn}" for isbn in isbns]
+        books = await cache_service.mget(cache_keys)
+
+        misses = []
+        for i, book in enumerate(books):
+            if not book:
+                misses.append(i)
+            elif book.get("__miss__"):
+                books[i] = None
+
+        # Cache misses share the pooled HTTP/2 connection
+        fetched = await asyncio.gather(
+            *(self._fetch_book_by_isbn(isbns[i]) for i in misses),
+            return_exceptions=True,
+        )
+
+        to_cache = {}
+        not_found = {}
+        for i, book in zip(misses, fetched):
+            if isinstance(book, httpx.HTTPError):
+                print(f"Naver API error: {book}")
+                book = None
+            elif isinstance(book, BaseException):
+                raise book
+            elif book:
+                to_cache[cache_keys[i]] = book
+            else:
+                not_found[cache_keys[i]] = _ISBN_MISS
+            books[i] = book
+
+        if to_cache:
             # Cache for 24 hours
-            await cache_service.set(cache_key, book, ttl=86400)
+            await cache_service.mset(to_cache, ttl=86400)
+        if not_found:
+            await cache_service.mset(not_found, ttl=ISBN_MISS_TTL)
 
-            return book
+        return books
 
-        except httpx.HTTPError as e:
-            print(f"Naver API error: {e}")
+    async def _fetch_book_by_isbn(self, isbn: str) -> Optional[dict]:
+        """Look up a single ISBN on the Naver API
+
+        Returns None when Naver has no match; HTTP errors propagate so
+        callers do not mistake an outage for a missing book.
+        """
+        # Clean ISBN (remove hyphens)
+        clean_isbn = isbn.replace("-", "")
+
+        response = await self._client.get(
+            self.DETAIL_URL,
+            params={
+                "d_isbn": clean_isbn,
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        items = data.get("items", [])
+        if not items:
             return None
 
+        return self._transform_book(items[0])
+
     def _transform_book(self, naver_item: dict) -> dict:
         """
         Transform Naver API book item to our format
@@ -186,33 +249,24 @@ class NaverBookService:
         authors = [a.strip() for a in authors_raw.split("^") if a.strip()]
         author = ", ".join(authors) if authors else None
 
-        # Parse publication date
-        pubdate = naver_item.get("pubdate", "")
+        # Parse publication date (YYYYMMDD, YYYYMM or YYYY)
         published_date = None
-        if len(pubdate) >= 8:
-            try:
-                published_date = date(int(pubdate[:4]), int(pubdate[4:6]), int(pubdate[6:8]))
-            except ValueError:
-                pass
-        elif len(pubdate) >= 6:
-            try:
-                published_date = date(int(pubdate[:4]), int(pubdate[4:6]), 1)
-            except ValueError:
-                pass
-        elif len(pubdate) >= 4:
+        match = _PUBDATE_RE.match(naver_item.get("pubdate") or "")
+        if match:
+            year, month, day = match.groups()
             try:
-                published_date = date(int(pubdate[:4]), 1, 1)
+                published_date = date(int(year), int(month or 1), int(day or 1))
             except ValueError:
                 pass
 
         return {
             "id": None,  # Will be assigned when saved to database
             "isbn": isbn,
-            "title": naver_item.get("title", "").replace("<b>", "").replace("</b>", ""),
+            "title": _BOLD_TAG_RE.sub("", naver_item.get("title", "")),
             "author": author,
             "publisher": naver_item.get("publisher", ""),
             "published_date": published_date,
-            "description": naver_item.get("description", "").replace("<b>", "").replace("</b>", ""),
+            "description": _BOLD_TAG_RE.sub("", naver_item.get("description", "")),
             "cover_image": naver_item.get("image"),
             "category": None,
             "naver_link": naver_item.get("link"),
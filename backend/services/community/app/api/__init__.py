@@ -1,10 +1,13 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
-from .quote_routes import router as quote_router
-from .review_routes import router as review_router
-from .feed_routes import router as feed_router
+from shared.middleware.auth import get_current_user
+from .quote_routes import register as register_quotes
+from .review_routes import register as register_reviews
+from .feed_routes import register as register_feed
 
-router = APIRouter()
-router.include_router(quote_router, prefix="/quotes", tags=["quotes"])
-router.include_router(review_router, prefix="/reviews", tags=["reviews"])
-router.include_router(feed_router, prefix="/feed", tags=["feed"])
+# Every community endpoint requires a user, so declare routes on one router
+# with the auth dependency instead of merging per-module routers
+router = APIRouter(dependencies=[Depends(get_current_user)])
+register_quotes(router)
+register_reviews(router)
+register_feed(router)
@@ -1,18 +1,15 @@
 from fastapi import APIRouter, Depends, Query
-from typing import Optional
 
 from shared.middleware.auth import get_current_user
-from ..schemas.community_schemas import FeedResponse, FeedItem
+from ..schemas.community_schemas import FeedResponse, feed_response_from_trusted
 from ..services.feed_service import FeedService
-
-router = APIRouter()
+from .responses import model_json_response
 
 
 def get_feed_service() -> FeedService:
     return FeedService()
 
 
-@router.get("/", response_model=FeedResponse)
 async def get_feed(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=50),
@@ -20,14 +17,14 @@ async def get_feed(
     feed_service: FeedService = Depends(get_feed_service),
 ):
     """Get personalized feed from followed users"""
-    return await feed_service.get_feed(
+    result = await feed_service.get_feed(
         user_id=current_user.user_id,
         page=page,
         page_size=page_size,
     )
+    return model_json_response(feed_response_from_trusted(result))
 
 
-@router.get("/discover", response_model=FeedResponse)
 async def get_discover_feed(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=50),
@@ -35,14 +32,14 @@ async def get_discover_feed(
     feed_service: FeedService = Depends(get_feed_service),
 ):
     """Get discover feed with popular content"""
-    return await feed_service.get_discover_feed(
+    result = await feed_service.get_discover_feed(
         user_id=current_user.user_id,
         page=page,
         page_size=page_size,
     )
+    return model_json_response(feed_response_from_trusted(result))
 
 
-@router.get("/trending", response_model=FeedResponse)
 async def get_trending(
     period: str = Query("week", pattern="^(day|week|month)$"),
     page: int = Query(1, ge=1),
@@ -51,15 +48,15 @@ async def get_trending(
     feed_service: FeedService = Depends(get_feed_service),
 ):
     """Get trending content"""
-    return await feed_service.get_trending(
+    result = await feed_service.get_trending(
         period=period,
         user_id=current_user.user_id,
         page=page,
         page_size=page_size,
     )
+    return model_json_response(feed_response_from_trusted(result))
 
 
-@router.get("/book/{book_id}", response_model=FeedResponse)
 async def get_book_feed(
     book_id: str,
     page: int = Query(1, ge=1),
@@ -68,15 +65,15 @@ async def get_book_feed(
     feed_service: FeedService = Depends(get_feed_service),
 ):
     """Get feed for a specific book (quotes and reviews)"""
-    return await feed_service.get_book_feed(
+    result = await feed_service.get_book_feed(
         book_id=book_id,
         user_id=current_user.user_id,
         page=page,
         page_size=page_size,
     )
+    return model_json_response(feed_response_from_trusted(result))
 
 
-@router.get("/user/{user_id}", response_model=FeedResponse)
 async def get_user_feed(
     user_id: str,
     page: int = Query(1, ge=1),
@@ -85,9 +82,54 @@ async def get_user_feed(
     feed_service: FeedService = Depends(get_feed_service),
 ):
     """Get feed from a specific user"""
-    return await feed_service.get_user_feed(
+    result = await feed_service.get_user_feed(
         target_user_id=user_id,
         viewer_id=current_user.user_id,
         page=page,
         page_size=page_size,
     )
+    return model_json_response(feed_response_from_trusted(result))
+
+
+def register(router: APIRouter) -> None:
+    """Declare feed endpoints on the shared community router"""
+    router.add_api_route(
+        "/feed/",
+        get_feed,
+        methods=["GET"],
+        response_model=None,
+        responses={200: {"model": FeedResponse}},
+        tags=["feed"],
+    )
+    router.add_api_route(
+        "/feed/discover",
+        get_discover_feed,
+        methods=["GET"],
+        response_model=None,
+        responses={200: {"model": FeedResponse}},
+        tags=["feed"],
+    )
+    router.add_api_route(
+        "/feed/trending",
+        get_trending,
+        methods=["GET"],
+        response_model=None,
+        responses={200: {"model": FeedResponse}},
+        tags=["feed"],
+    )
+    router.add_api_route(
+        "/feed/book/{book_id}",
+        get_book_feed,
+        methods=["GET"],
+        response_model=None,
+        responses={200: {"model": FeedResponse}},
+        tags=["feed"],
+    )
+    router.add_api_route(
+        "/feed/user/{user_id}",
+        get_user_feed,
+        methods=["GET"],
+        response_model=None,
+        responses={200: {"model": FeedResponse}},
+        tags=["feed"],
+    )
@@ -7,17 +7,16 @@ from ..schemas.community_schemas import (
     QuoteUpdateRequest,
     QuoteResponse,
     QuoteListResponse,
+    quote_list_response,
 )
 from ..services.quote_service import QuoteService
-
-router = APIRouter()
+from .responses import model_json_response
 
 
 def get_quote_service() -> QuoteService:
     return QuoteService()
 
 
-@router.post("/", response_model=QuoteResponse, status_code=status.HTTP_201_CREATED)
 async def create_quote(
     data: QuoteCreateRequest,
     current_user: dict = Depends(get_current_user),
@@ -31,7 +30,6 @@ async def create_quote(
     return quote
 
 
-@router.get("/", response_model=QuoteListResponse)
 async def get_quotes(
     book_id: Optional[str] = Query(None),
     user_id: Optional[str] = Query(None),
@@ -41,16 +39,16 @@ async def get_quotes(
     quote_service: QuoteService = Depends(get_quote_service),
 ):
     """Get quotes with optional filters"""
-    return await quote_service.get_quotes(
+    result = await quote_service.get_quotes(
         book_id=book_id,
         user_id=user_id,
         viewer_id=current_user.user_id,
         page=page,
         page_size=page_size,
     )
+    return model_json_response(quote_list_response(result))
 
 
-@router.get("/me", response_model=QuoteListResponse)
 async def get_my_quotes(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=50),
@@ -58,15 +56,15 @@ async def get_my_quotes(
     quote_service: QuoteService = Depends(get_quote_service),
 ):
     """Get current user's quotes"""
-    return await quote_service.get_quotes(
+    result = await quote_service.get_quotes(
         user_id=current_user.user_id,
         viewer_id=current_user.user_id,
         page=page,
         page_size=page_size,
     )
+    return model_json_response(quote_list_response(result))
 
 
-@router.get("/{quote_id}", response_model=QuoteResponse)
 async def get_quote(
     quote_id: str,
     current_user: dict = Depends(get_current_user),
@@ -85,7 +83,6 @@ async def get_quote(
     return quote
 
 
-@router.patch("/{quote_id}", response_model=QuoteResponse)
 async def update_quote(
     quote_id: str,
     data: QuoteUpdateRequest,
@@ -106,7 +103,6 @@ async def update_quote(
     return quote
 
 
-@router.delete("/{quote_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_quote(
     quote_id: str,
     current_user: dict = Depends(get_current_user),
@@ -124,7 +120,6 @@ async def delete_quote(
         )
 
 
-@router.post("/{quote_id}/like")
 async def like_quote(
     quote_id: str,
     current_user: dict = Depends(get_current_user),
@@ -143,7 +138,6 @@ async def like_quote(
     return {"status": "liked"}
 
 
-@router.delete("/{quote_id}/like")
 async def unlike_quote(
     quote_id: str,
     current_user: dict = Depends(get_current_user),
@@ -155,3 +149,64 @@ async def unlike_quote(
         user_id=current_user.user_id,
     )
     return {"status": "unliked"}
+
+
+def register(router: APIRouter) -> None:
+    """Declare quote endpoints on the shared community router"""
+    router.add_api_route(
+        "/quotes/",
+        create_quote,
+        methods=["POST"],
+        response_model=QuoteResponse,
+        status_code=status.HTTP_201_CREATED,
+        tags=["quotes"],
+    )
+    router.add_api_route(
+        "/quotes/",
+        get_quotes,
+        methods=["GET"],
+        response_model=None,
+        responses={200: {"model": QuoteListResponse}},
+        tags=["quotes"],
+    )
+    router.add_api_route(
+        "/quotes/me",
+        get_my_quotes,
+        methods=["GET"],
+        response_model=None,
+        responses={200: {"model": QuoteListResponse}},
+        tags=["quotes"],
+    )
+    router.add_api_route(
+        "/quotes/{quote_id}",
+        get_quote,
+        methods=["GET"],
+        response_model=QuoteResponse,
+        tags=["quotes"],
+    )
+    router.add_api_route(
+        "/quotes/{quote_id}",
+        update_quote,
+        methods=["PATCH"],
+        response_model=QuoteResponse,
+        tags=["quotes"],
+    )
+    router.add_api_route(
+        "/quotes/{quote_id}",
+        delete_quote,
+        methods=["DELETE"],
+        status_code=status.HTTP_204_NO_CONTENT,
+        tags=["quotes"],
+    )
+    router.add_api_route(
+        "/quotes/{quote_id}/like",
+        like_quote,
+        methods=["POST"],
+        tags=["quotes"],
+    )
+    router.add_api_route(
+        "/quotes/{quote_id}/like",
+        unlike_quote,
+        methods=["DELETE"],
+        tags=["quotes"],
+    )
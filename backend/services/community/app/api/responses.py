@@ -0,0 +1,7 @@
+from fastapi import Response
+from pydantic import BaseModel
+
+
+def model_json_response(model: BaseModel) -> Response:
+    """Render a response model with pydantic's serializer, bypassing jsonable_encoder"""
+    return Response(model.model_dump_json(), media_type="application/json")
@@ -7,17 +7,16 @@ from ..schemas.community_schemas import (
     ReviewUpdateRequest,
     ReviewResponse,
     ReviewListResponse,
+    review_list_response,
 )
 from ..services.review_service import ReviewService
-
-router = APIRouter()
+from .responses import model_json_response
 
 
 def get_review_service() -> ReviewService:
     return ReviewService()
 
 
-@router.post("/", response_model=ReviewResponse, status_code=status.HTTP_201_CREATED)
 async def create_review(
     data: ReviewCreateRequest,
     current_user: dict = Depends(get_current_user),
@@ -31,26 +30,35 @@ async def create_review(
     return review
 
 
-@router.get("/", response_model=ReviewListResponse)
 async def get_reviews(
     book_id: Optional[str] = Query(None),
     user_id: Optional[str] = Query(None),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=50),
+    include_total: bool = Query(False),
+    cursor: Optional[str] = Query(None),
     current_user: dict = Depends(get_current_user),
     review_service: ReviewService = Depends(get_review_service),
 ):
-    """Get reviews with optional filters"""
-    return await review_service.get_reviews(
-        book_id=book_id,
-        user_id=user_id,
-        viewer_id=current_user.user_id,
-        page=page,
-        page_size=page_size,
-    )
+    """
+    Get reviews with optional filters
+    Pass next_cursor from the previous page to seek instead of paging by offset
+    """
+    try:
+        result = await review_service.get_reviews(
+            book_id=book_id,
+            user_id=user_id,
+            viewer_id=current_user.user_id,
+            page=page,
+            page_size=page_size,
+            include_total=include_total,
+            cursor=cursor,
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return model_json_response(review_list_response(result))
 
 
-@router.get("/{review_id}", response_model=ReviewResponse)
 async def get_review(
     review_id: str,
     current_user: dict = Depends(get_current_user),
@@ -69,7 +77,6 @@ async def get_review(
     return review
 
 
-@router.patch("/{review_id}", response_model=ReviewResponse)
 async def update_review(
     review_id: str,
     data: ReviewUpdateRequest,
@@ -90,7 +97,6 @@ async def update_review(
     return review
 
 
-@router.delete("/{review_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_review(
     review_id: str,
     current_user: dict = Depends(get_current_user),
@@ -108,7 +114,6 @@ async def delete_review(
         )
 
 
-@router.post("/{review_id}/like")
 async def like_review(
     review_id: str,
     current_user: dict = Depends(get_current_user),
@@ -127,7 +132,6 @@ async def like_review(
     return {"status": "liked"}
 
 
-@router.delete("/{review_id}/like")
 async def unlike_review(
     review_id: str,
     current_user: dict = Depends(get_current_user),
@@ -141,7 +145,6 @@ async def unlike_review(
     return {"status": "unliked"}
 
 
-@router.post("/{review_id}/comments")
 async def add_comment(
     review_id: str,
     content: str = Query(..., min_length=1, max_length=500),
@@ -160,3 +163,62 @@ async def add_comment(
             detail="Review not found",
         )
     return comment
+
+
+def register(router: APIRouter) -> None:
+    """Declare review endpoints on the shared community router"""
+    router.add_api_route(
+        "/reviews/",
+        create_review,
+        methods=["POST"],
+        response_model=ReviewResponse,
+        status_code=status.HTTP_201_CREATED,
+        tags=["reviews"],
+    )
+    router.add_api_route(
+        "/reviews/",
+        get_reviews,
+        methods=["GET"],
+        response_model=None,
+        responses={200: {"model": ReviewListResponse}},
+        tags=["reviews"],
+    )
+    router.add_api_route(
+        "/reviews/{review_id}",
+        get_review,
+        methods=["GET"],
+        response_model=ReviewResponse,
+        tags=["reviews"],
+    )
+    router.add_api_route(
+        "/reviews/{review_id}",
+        update_review,
+        methods=["PATCH"],
+        response_model=ReviewResponse,
+        tags=["reviews"],
+    )
+    router.add_api_route(
+        "/reviews/{review_id}",
+        delete_review,
+        methods=["DELETE"],
+        status_code=status.HTTP_204_NO_CONTENT,
+        tags=["reviews"],
+    )
+    router.add_api_route(
+        "/reviews/{review_id}/like",
+        like_review,
+        methods=["POST"],
+        tags=["reviews"],
+    )
+    router.add_api_route(
+        "/reviews/{review_id}/like",
+        unlike_review,
+        methods=["DELETE"],
+        tags=["reviews"],
+    )
+    router.add_api_route(
+        "/reviews/{review_id}/comments",
+        add_comment,
+        methods=["POST"],
+        tags=["reviews"],
+    )
@@ -1,18 +1,28 @@
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from shared.core.config import settings
+from shared.core.database import close_db, warmup_db_pool
 from shared.middleware.rate_limit import RateLimitMiddleware
 from .api import router
+from .services.feed_service import run_discover_warmer, run_trending_refresher
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler"""
     print("Community Service starting...")
+    await warmup_db_pool(settings.DB_POOL_WARMUP)
+    trending_refresher = asyncio.create_task(run_trending_refresher())
+    discover_warmer = asyncio.create_task(run_discover_warmer())
     yield
     print("Community Service shutting down...")
+    discover_warmer.cancel()
+    trending_refresher.cancel()
+    await close_db()
 
 
 app = FastAPI(
@@ -20,6 +30,7 @@ app = FastAPI(
     description="Community features: quotes, reviews, feed",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if settings.ENVIRONMENT != "production" else None,
     redoc_url="/redoc" if settings.ENVIRONMENT != "production" else None,
 )
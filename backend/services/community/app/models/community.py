@@ -1,7 +1,7 @@
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, Float, Boolean, Text, DateTime, ForeignKey
+from sqlalchemy import Column, String, Integer, Float, Boolean, Text, DateTime, ForeignKey, Index, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import UUID
-import uuid
+from uuid6 import uuid7
 
 from shared.core.database import Base
 
@@ -9,8 +9,22 @@ from shared.core.database import Base
 class Quote(Base):
     """Quote model"""
     __tablename__ = "quotes"
-
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __table_args__ = (
+        Index("ix_quotes_book_created", "book_id", text("created_at DESC"), text("id DESC")),
+        Index("ix_quotes_user_created", "user_id", text("created_at DESC"), text("id DESC")),
+        Index(
+            "ix_quotes_public_created",
+            text("created_at DESC"), text("id DESC"),
+            postgresql_where=text("is_public"),
+        ),
+        Index(
+            "ix_quotes_public_likes",
+            text("likes_count DESC NULLS LAST"), text("created_at DESC"), text("id DESC"),
+            postgresql_where=text("is_public"),
+        ),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("uuid_generate_v4()"))
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     book_id = Column(UUID(as_uuid=True), ForeignKey("books.id"), nullable=False, index=True)
 
@@ -37,8 +51,23 @@ class QuoteLike(Base):
 class Review(Base):
     """Book review model"""
     __tablename__ = "reviews"
-
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __table_args__ = (
+        UniqueConstraint("user_id", "book_id", name="uq_user_review"),
+        Index("ix_reviews_book_created", "book_id", text("created_at DESC"), text("id DESC")),
+        Index("ix_reviews_user_created", "user_id", text("created_at DESC"), text("id DESC")),
+        Index(
+            "ix_reviews_public_created",
+            text("created_at DESC"), text("id DESC"),
+            postgresql_where=text("is_public"),
+        ),
+        Index(
+            "ix_reviews_public_likes",
+            text("likes_count DESC NULLS LAST"), text("created_at DESC"), text("id DESC"),
+            postgresql_where=text("is_public"),
+        ),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("uuid_generate_v4()"))
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     book_id = Column(UUID(as_uuid=True), ForeignKey("books.id"), nullable=False, index=True)
 
@@ -46,6 +75,7 @@ class Review(Base):
     content = Column(Text, nullable=False)
     has_spoiler = Column(Boolean, default=False)
     likes_count = Column(Integer, default=0)
+    comments_count = Column(Integer, default=0, server_default="0", nullable=False)
 
     is_public = Column(Boolean, default=True)
 
@@ -56,8 +86,11 @@ class Review(Base):
 class ReviewLike(Base):
     """Review like model"""
     __tablename__ = "review_likes"
+    __table_args__ = (
+        UniqueConstraint("review_id", "user_id", name="uq_review_likes"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("uuid_generate_v4()"))
     review_id = Column(UUID(as_uuid=True), ForeignKey("reviews.id", ondelete="CASCADE"), nullable=False, index=True)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
 
@@ -67,8 +100,11 @@ class ReviewLike(Base):
 class Comment(Base):
     """Comment on reviews or quotes"""
     __tablename__ = "comments"
+    __table_args__ = (
+        Index("ix_comments_parent", "parent_type", "parent_id"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("uuid_generate_v4()"))
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     parent_type = Column(String(50), nullable=False)  # review, quote
     parent_id = Column(UUID(as_uuid=True), nullable=False, index=True)
@@ -1,6 +1,8 @@
-from typing import Optional, List, Literal
+from dataclasses import fields
+from typing import Any, Optional, List, Literal
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+from typing_extensions import TypedDict
 
 
 # Quote schemas
@@ -22,20 +24,21 @@ class QuoteUpdateRequest(BaseModel):
     is_public: Optional[bool] = None
 
 
-class QuoteAuthor(BaseModel):
+# Nested shapes are TypedDicts so they validate inline with the parent model
+class QuoteAuthor(TypedDict):
     """Quote author info"""
     id: str
     nickname: str
-    avatar_url: Optional[str] = None
+    avatar_url: Optional[str]
     level: int
 
 
-class QuoteBook(BaseModel):
+class QuoteBook(TypedDict):
     """Quote book info"""
     id: str
     title: str
     author: str
-    cover_image_url: Optional[str] = None
+    cover_image_url: Optional[str]
 
 
 class QuoteResponse(BaseModel):
@@ -59,7 +62,7 @@ class QuoteResponse(BaseModel):
 class QuoteListResponse(BaseModel):
     """Quote list response"""
     items: List[QuoteResponse]
-    total: int
+    total: Optional[int] = None  # Not counted; use has_more
     page: int
     page_size: int
     has_more: bool
@@ -108,13 +111,14 @@ class ReviewResponse(BaseModel):
 class ReviewListResponse(BaseModel):
     """Review list response"""
     items: List[ReviewResponse]
-    total: int
+    total: Optional[int] = None  # Only counted with include_total; use has_more
     page: int
     page_size: int
     has_more: bool
+    next_cursor: Optional[str] = None
 
 
-class CommentResponse(BaseModel):
+class CommentResponse(TypedDict):
     """Comment response"""
     id: str
     content: str
@@ -146,3 +150,39 @@ class FeedResponse(BaseModel):
     page: int
     page_size: int
     has_more: bool
+
+
+# Trusted-input constructors: feed payloads are assembled by our own services
+# from database rows, so build response models without running validators
+def feed_item_from_trusted(item: Any) -> FeedItem:
+    """Build a FeedItem from a trusted service dataclass"""
+    return FeedItem.model_construct(**{f.name: getattr(item, f.name) for f in fields(item)})
+
+
+def feed_response_from_trusted(data: dict) -> FeedResponse:
+    """Build a FeedResponse from trusted service output"""
+    return FeedResponse.model_construct(**{
+        **data,
+        "items": [feed_item_from_trusted(item) for item in data["items"]],
+    })
+
+
+# Item list validators built once and shared by the list routes
+QUOTE_ITEMS_ADAPTER = TypeAdapter(List[QuoteResponse])
+REVIEW_ITEMS_ADAPTER = TypeAdapter(List[ReviewResponse])
+
+
+def quote_list_response(data: dict) -> QuoteListResponse:
+    """Validate quote items once and wrap them without revalidating the page"""
+    return QuoteListResponse.model_construct(**{
+        **data,
+        "items": QUOTE_ITEMS_ADAPTER.validate_python(data["items"]),
+    })
+
+
+def review_list_response(data: dict) -> ReviewListResponse:
+    """Validate review items once and wrap them without revalidating the page"""
+    return ReviewListResponse.model_construct(**{
+        **data,
+        "items": REVIEW_ITEMS_ADAPTER.validate_python(data["items"]),
+    })
@@ -1,17 +1,132 @@
-from typing import Optional, List
+import asyncio
+import math
+import random
+import time
+from dataclasses import dataclass, replace
+from functools import partial
+from typing import Optional, List, Dict, Set, Tuple, Callable, Awaitable
 from datetime import datetime, timedelta
 
-from sqlalchemy import select, func, or_, and_
+from sqlalchemy import select, func, literal, union_all, table, column, text
 
 from shared.core.database import get_db_session
 from shared.core.redis import cache_service
+from .lookups import fetch_authors_and_books
 from ..models.community import Quote, Review, QuoteLike, ReviewLike
 
 
+# Columns read by the feed item builders
+_QUOTE_FEED_COLUMNS = (
+    Quote.id,
+    Quote.user_id,
+    Quote.book_id,
+    Quote.content,
+    Quote.page_number,
+    Quote.memo,
+    Quote.likes_count,
+    Quote.created_at,
+)
+
+# Feed items show a preview of the review; one extra character tells
+# whether it was cut, so the full text never leaves the database
+REVIEW_PREVIEW_LENGTH = 200
+_REVIEW_FEED_COLUMNS = (
+    Review.id,
+    Review.user_id,
+    Review.book_id,
+    func.left(Review.content, REVIEW_PREVIEW_LENGTH + 1).label("preview"),
+    Review.rating,
+    Review.has_spoiler,
+    Review.likes_count,
+    Review.comments_count,
+    Review.created_at,
+)
+
+
+@dataclass(slots=True)
+class FeedItemRaw:
+    """Feed item as built by the service, before response serialization"""
+    id: str
+    type: str
+    content: str
+    author: dict
+    book: dict
+    created_at: datetime
+    rating: Optional[float] = None
+    page_number: Optional[int] = None
+    memo: Optional[str] = None
+    has_spoiler: Optional[bool] = None
+    likes_count: int = 0
+    comments_count: int = 0
+    is_liked: bool = False
+
+
+# Versioned so a change in the cached page shape can bypass old entries
+DISCOVER_FEED_KEY = "v2:discover_feed"
+BOOK_FEED_KEY = "v2:book_feed:{book_id}"
+USER_FEED_KEY = "v2:user_feed:{user_id}"
+
+# Discover pages kept warm by run_discover_warmer; the routes default to 20
+DISCOVER_WARM_PAGE_SIZES = (20,)
+DISCOVER_WARM_INTERVAL = 240  # Ahead of the 5 minute page TTL
+
+# Materialized top-1000 lists per period, see migration 013
+TRENDING_PERIODS = {"day": 1, "week": 7, "month": 30}
+TRENDING_REFRESH_INTERVAL = 600  # 10 minutes
+_TRENDING_QUOTES = {
+    period: table(f"trending_quotes_{period}", column("id"))
+    for period in TRENDING_PERIODS
+}
+_TRENDING_REVIEWS = {
+    period: table(f"trending_reviews_{period}", column("id"))
+    for period in TRENDING_PERIODS
+}
+
+
+async def refresh_trending_views() -> None:
+    """Recompute the materialized trending views without blocking readers"""
+    async with get_db_session() as session:
+        for view in [*_TRENDING_QUOTES.values(), *_TRENDING_REVIEWS.values()]:
+            await session.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view.name}"))
+
+
+async def run_trending_refresher() -> None:
+    """Refresh trending views periodically; one worker refreshes per interval"""
+    while True:
+        try:
+            if await cache_service.set_nx(
+                "trending:refresh:lock", "1", ttl=TRENDING_REFRESH_INTERVAL - 30
+            ):
+                await refresh_trending_views()
+        except Exception as e:
+            print(f"Trending view refresh failed: {e}")
+        await asyncio.sleep(TRENDING_REFRESH_INTERVAL)
+
+
+# Page rebuilds in flight in this process, keyed by cache key
+_rebuilds: Dict[str, asyncio.Task] = {}
+
+
+def _finish_rebuild(cache_key: str, task: asyncio.Task) -> None:
+    """Forget a finished rebuild, consuming its error if nobody awaited it"""
+    _rebuilds.pop(cache_key, None)
+    if not task.cancelled() and task.exception() is not None:
+        print(f"Feed cache rebuild failed for {cache_key}: {task.exception()}")
+
+
+async def invalidate_feed_caches(user_id: str, book_id: str) -> None:
+    """Drop cached book and author feed pages after their content changes"""
+    await cache_service.delete_pattern(BOOK_FEED_KEY.format(book_id=book_id) + ":*")
+    await cache_service.delete_pattern(USER_FEED_KEY.format(user_id=user_id) + ":*")
+
+
 class FeedService:
     """Service for generating user feeds"""
 
     CACHE_TTL = 300  # 5 minutes
+    FEED_CACHE_TTL = 60  # Book and user feeds
+    LOCK_TTL = 5
+    XFETCH_BETA = 1.0
 
     async def get_feed(
         self,
@@ -27,53 +142,14 @@ class FeedService:
             # Return discover feed if no followers
             return await self.get_discover_feed(user_id, page, page_size)
 
-        async with get_db_session() as session:
-            # Get quotes from followed users
-            quotes = await session.execute(
-                select(Quote)
-                .where(
-                    Quote.user_id.in_(following_ids),
-                    Quote.is_public == True,
-                )
-                .order_by(Quote.created_at.desc())
-                .limit(page_size * 2)  # Get more for mixing
-            )
-            quotes_list = quotes.scalars().all()
-
-            # Get reviews from followed users
-            reviews = await session.execute(
-                select(Review)
-                .where(
-                    Review.user_id.in_(following_ids),
-                    Review.is_public == True,
-                )
-                .order_by(Review.created_at.desc())
-                .limit(page_size * 2)
-            )
-            reviews_list = reviews.scalars().all()
-
-            # Merge and sort by created_at
-            items = []
-            for quote in quotes_list:
-                items.append(await self._quote_to_feed_item(session, quote, user_id))
-            for review in reviews_list:
-                items.append(await self._review_to_feed_item(session, review, user_id))
-
-            # Sort by created_at
-            items.sort(key=lambda x: x["created_at"], reverse=True)
-
-            # Paginate
-            start = (page - 1) * page_size
-            end = start + page_size
-            paginated_items = items[start:end]
-
-            return {
-                "items": paginated_items,
-                "total": len(items),
-                "page": page,
-                "page_size": page_size,
-                "has_more": end < len(items),
-            }
+        return await self._get_page(
+            quote_filters=(Quote.user_id.in_(following_ids), Quote.is_public == True),
+            review_filters=(Review.user_id.in_(following_ids), Review.is_public == True),
+            by_likes=False,
+            viewer_id=user_id,
+            page=page,
+            page_size=page_size,
+        )
 
     async def get_discover_feed(
         self,
@@ -82,58 +158,34 @@ class FeedService:
         page_size: int = 20,
     ) -> dict:
         """Get discover feed with popular content"""
-        # Try cache first
-        cache_key = f"discover_feed:{page}:{page_size}"
-        cached = await cache_service.get(cache_key)
-        if cached:
-            # Update is_liked for viewer
-            for item in cached["items"]:
-                item["is_liked"] = await self._check_liked(item["id"], item["type"], user_id)
-            return cached
-
-        async with get_db_session() as session:
-            # Get popular quotes (by likes_count stored in table)
-            popular_quotes = await session.execute(
-                select(Quote)
-                .where(Quote.is_public == True)
-                .order_by(Quote.likes_count.desc())
-                .limit(page_size)
+        # Popular content by likes_count stored in table
+        return await self._get_cached_page(
+            f"{DISCOVER_FEED_KEY}:{page}:{page_size}",
+            self.CACHE_TTL,
+            user_id,
+            self._discover_loader(page, page_size),
+        )
+
+    async def warm_discover_feed(self) -> None:
+        """Rebuild the first discover pages before they expire"""
+        for page_size in DISCOVER_WARM_PAGE_SIZES:
+            await self._start_rebuild(
+                f"{DISCOVER_FEED_KEY}:1:{page_size}",
+                self.CACHE_TTL,
+                self._discover_loader(1, page_size),
             )
 
-            # Get popular reviews (by likes_count stored in table)
-            popular_reviews = await session.execute(
-                select(Review)
-                .where(Review.is_public == True)
-                .order_by(Review.likes_count.desc())
-                .limit(page_size)
-            )
-
-            items = []
-            for quote in popular_quotes.scalars().all():
-                items.append(await self._quote_to_feed_item(session, quote, user_id))
-            for review in popular_reviews.scalars().all():
-                items.append(await self._review_to_feed_item(session, review, user_id))
-
-            # Sort by likes
-            items.sort(key=lambda x: x["likes_count"], reverse=True)
-
-            # Paginate
-            start = (page - 1) * page_size
-            end = start + page_size
-            paginated_items = items[start:end]
-
-            result = {
-                "items": paginated_items,
-                "total": len(items),
-                "page": page,
-                "page_size": page_size,
-                "has_more": end < len(items),
-            }
-
-            # Cache
-            await cache_service.set(cache_key, result, ttl=self.CACHE_TTL)
-
-            return result
+    def _discover_loader(self, page: int, page_size: int) -> Callable[[], Awaitable[dict]]:
+        """Build the viewer-agnostic loader for a discover page"""
+        return partial(
+            self._get_page,
+            quote_filters=(Quote.is_public == True,),
+            review_filters=(Review.is_public == True,),
+            by_likes=True,
+            viewer_id=None,
+            page=page,
+            page_size=page_size,
+        )
 
     async def get_trending(
         self,
@@ -143,50 +195,31 @@ class FeedService:
         page_size: int = 20,
     ) -> dict:
         """Get trending content for period"""
-        days = {"day": 1, "week": 7, "month": 30}.get(period, 7)
-        since = datetime.utcnow() - timedelta(days=days)
-
-        async with get_db_session() as session:
-            # Get trending quotes (by likes_count)
-            trending_quotes = await session.execute(
-                select(Quote)
-                .where(
-                    Quote.is_public == True,
-                    Quote.created_at >= since,
-                )
-                .order_by(Quote.likes_count.desc())
-                .limit(page_size)
-            )
-
-            # Get trending reviews (by likes_count)
-            trending_reviews = await session.execute(
-                select(Review)
-                .where(
-                    Review.is_public == True,
-                    Review.created_at >= since,
-                )
-                .order_by(Review.likes_count.desc())
-                .limit(page_size)
-            )
-
-            items = []
-            for quote in trending_quotes.scalars().all():
-                items.append(await self._quote_to_feed_item(session, quote, user_id))
-            for review in trending_reviews.scalars().all():
-                items.append(await self._review_to_feed_item(session, review, user_id))
-
-            items.sort(key=lambda x: x["likes_count"], reverse=True)
-
-            start = (page - 1) * page_size
-            end = start + page_size
-
-            return {
-                "items": items[start:end],
-                "total": len(items),
-                "page": page,
-                "page_size": page_size,
-                "has_more": end < len(items),
-            }
+        if period not in TRENDING_PERIODS:
+            period = "week"
+        since = datetime.utcnow() - timedelta(days=TRENDING_PERIODS[period])
+
+        # Candidates come from the precomputed view; live columns still
+        # decide visibility and order between refreshes
+        trending_quotes = select(_TRENDING_QUOTES[period].c.id)
+        trending_reviews = select(_TRENDING_REVIEWS[period].c.id)
+
+        return await self._get_page(
+            quote_filters=(
+                Quote.id.in_(trending_quotes),
+                Quote.is_public == True,
+                Quote.created_at >= since,
+            ),
+            review_filters=(
+                Review.id.in_(trending_reviews),
+                Review.is_public == True,
+                Review.created_at >= since,
+            ),
+            by_likes=True,
+            viewer_id=user_id,
+            page=page,
+            page_size=page_size,
+        )
 
     async def get_book_feed(
         self,
@@ -196,36 +229,20 @@ class FeedService:
         page_size: int = 20,
     ) -> dict:
         """Get feed for a specific book"""
-        async with get_db_session() as session:
-            quotes = await session.execute(
-                select(Quote)
-                .where(Quote.book_id == book_id, Quote.is_public == True)
-                .order_by(Quote.created_at.desc())
-            )
-            reviews = await session.execute(
-                select(Review)
-                .where(Review.book_id == book_id, Review.is_public == True)
-                .order_by(Review.created_at.desc())
-            )
-
-            items = []
-            for quote in quotes.scalars().all():
-                items.append(await self._quote_to_feed_item(session, quote, user_id))
-            for review in reviews.scalars().all():
-                items.append(await self._review_to_feed_item(session, review, user_id))
-
-            items.sort(key=lambda x: x["created_at"], reverse=True)
-
-            start = (page - 1) * page_size
-            end = start + page_size
-
-            return {
-                "items": items[start:end],
-                "total": len(items),
-                "page": page,
-                "page_size": page_size,
-                "has_more": end < len(items),
-            }
+        return await self._get_cached_page(
+            f"{BOOK_FEED_KEY.format(book_id=book_id)}:{page}:{page_size}",
+            self.FEED_CACHE_TTL,
+            user_id,
+            partial(
+                self._get_page,
+                quote_filters=(Quote.book_id == book_id, Quote.is_public == True),
+                review_filters=(Review.book_id == book_id, Review.is_public == True),
+                by_likes=False,
+                viewer_id=None,
+                page=page,
+                page_size=page_size,
+            ),
+        )
 
     async def get_user_feed(
         self,
@@ -235,115 +252,313 @@ class FeedService:
         page_size: int = 20,
     ) -> dict:
         """Get feed from a specific user"""
+        return await self._get_cached_page(
+            f"{USER_FEED_KEY.format(user_id=target_user_id)}:{page}:{page_size}",
+            self.FEED_CACHE_TTL,
+            viewer_id,
+            partial(
+                self._get_page,
+                quote_filters=(Quote.user_id == target_user_id, Quote.is_public == True),
+                review_filters=(Review.user_id == target_user_id, Review.is_public == True),
+                by_likes=False,
+                viewer_id=None,
+                page=page,
+                page_size=page_size,
+            ),
+        )
+
+    async def _get_cached_page(
+        self,
+        cache_key: str,
+        ttl: int,
+        viewer_id: str,
+        load: Callable[[], Awaitable[dict]],
+    ) -> dict:
+        """Read a feed page through the cache, letting one request rebuild it"""
+        entry = await cache_service.get(cache_key)
+        if entry is None:
+            page = await asyncio.shield(self._start_rebuild(cache_key, ttl, load))
+            if page is None:
+                # Another process is rebuilding this page; wait briefly for it
+                for _ in range(10):
+                    await asyncio.sleep(0.05)
+                    entry = await cache_service.get(cache_key)
+                    if entry is not None:
+                        page = self._page_from_cache(entry["value"])
+                        break
+                else:
+                    page = await load()
+            else:
+                # Rebuilt pages are shared by every waiter in this process
+                page = {**page, "items": [replace(item) for item in page["items"]]}
+        else:
+            page = self._page_from_cache(entry["value"])
+            # XFetch: refresh ahead of expiry with rising probability, scaled
+            # by how long the page takes to build, so readers never see a miss
+            jitter = entry["delta"] * self.XFETCH_BETA * math.log(1.0 - random.random())
+            if time.time() - jitter >= entry["expires_at"]:
+                self._start_rebuild(cache_key, ttl, load)
+
+        await self._apply_viewer_likes(page["items"], viewer_id)
+        return page
+
+    def _start_rebuild(
+        self,
+        cache_key: str,
+        ttl: int,
+        load: Callable[[], Awaitable[dict]],
+    ) -> asyncio.Task:
+        """Start rebuilding a cached page unless this process already is"""
+        task = _rebuilds.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(self._rebuild(cache_key, ttl, load))
+            _rebuilds[cache_key] = task
+            task.add_done_callback(lambda done: _finish_rebuild(cache_key, done))
+        return task
+
+    async def _rebuild(
+        self,
+        cache_key: str,
+        ttl: int,
+        load: Callable[[], Awaitable[dict]],
+    ) -> Optional[dict]:
+        """Rebuild and store a cached page; None if another process holds the lock"""
+        lock_key = f"{cache_key}:lock"
+        if not await cache_service.set_nx(lock_key, "1", ttl=self.LOCK_TTL):
+            return None
+
+        try:
+            started = time.monotonic()
+            page = await load()
+            entry = {
+                "value": page,
+                "delta": time.monotonic() - started,
+                "expires_at": time.time() + ttl,
+            }
+            await cache_service.set(cache_key, entry, ttl=ttl)
+        finally:
+            await cache_service.delete(lock_key)
+        return page
+
+    @staticmethod
+    def _page_from_cache(page: dict) -> dict:
+        """Restore feed items decoded from the cache"""
+        # The cache writes naive datetimes as UTC with "Z"; strip the zone so
+        # cached pages serialize exactly like freshly built ones
+        page["items"] = [
+            FeedItemRaw(**{
+                **item,
+                "created_at": datetime.fromisoformat(item["created_at"]).replace(tzinfo=None),
+            })
+            for item in page["items"]
+        ]
+        return page
+
+    async def _apply_viewer_likes(self, items: List[FeedItemRaw], viewer_id: str) -> None:
+        """Set is_liked on cached feed items for the current viewer"""
         async with get_db_session() as session:
-            quotes = await session.execute(
-                select(Quote)
-                .where(Quote.user_id == target_user_id, Quote.is_public == True)
-                .order_by(Quote.created_at.desc())
+            liked_quotes, liked_reviews = await self._bulk_liked_sets(
+                session,
+                [item.id for item in items if item.type == "quote"],
+                [item.id for item in items if item.type == "review"],
+                viewer_id,
             )
-            reviews = await session.execute(
-                select(Review)
-                .where(Review.user_id == target_user_id, Review.is_public == True)
-                .order_by(Review.created_at.desc())
+        for item in items:
+            liked = liked_quotes if item.type == "quote" else liked_reviews
+            item.is_liked = item.id in liked
+
+    async def _get_page(
+        self,
+        quote_filters: tuple,
+        review_filters: tuple,
+        by_likes: bool,
+        viewer_id: Optional[str],
+        page: int,
+        page_size: int,
+    ) -> dict:
+        """Get one page of quotes and reviews, merged and ordered by the database"""
+        async with get_db_session() as session:
+            # Order and paginate both sources together, reading only sort keys
+            feed = union_all(
+                select(
+                    Quote.id.label("id"),
+                    literal("quote").label("type"),
+                    Quote.created_at.label("created_at"),
+                    Quote.likes_count.label("likes_count"),
+                ).where(*quote_filters),
+                select(
+                    Review.id,
+                    literal("review"),
+                    Review.created_at,
+                    Review.likes_count,
+                ).where(*review_filters),
+            ).subquery()
+
+            order = (feed.c.created_at.desc(), feed.c.id.desc())
+            if by_likes:
+                order = (feed.c.likes_count.desc().nulls_last(), *order)
+
+            # One extra row tells whether another page exists
+            page_rows = (
+                await session.execute(
+                    select(feed.c.id, feed.c.type)
+                    .order_by(*order)
+                    .offset((page - 1) * page_size)
+                    .limit(page_size + 1)
+                )
+            ).all()
+            has_more = len(page_rows) > page_size
+            page_rows = page_rows[:page_size]
+
+            # True total across both sources, counted in one round-trip
+            total = await session.scalar(
+                select(
+                    select(func.count()).select_from(Quote).where(*quote_filters).scalar_subquery()
+                    + select(func.count()).select_from(Review).where(*review_filters).scalar_subquery()
+                )
             )
 
-            items = []
-            for quote in quotes.scalars().all():
-                items.append(await self._quote_to_feed_item(session, quote, viewer_id))
-            for review in reviews.scalars().all():
-                items.append(await self._review_to_feed_item(session, review, viewer_id))
+            # Load the rows on this page only
+            quote_ids = [row.id for row in page_rows if row.type == "quote"]
+            review_ids = [row.id for row in page_rows if row.type == "review"]
+            quotes = {}
+            reviews = {}
+            if quote_ids:
+                result = await session.execute(
+                    select(*_QUOTE_FEED_COLUMNS).where(Quote.id.in_(quote_ids))
+                )
+                quotes = {quote.id: quote for quote in result}
+            if review_ids:
+                result = await session.execute(
+                    select(*_REVIEW_FEED_COLUMNS).where(Review.id.in_(review_ids))
+                )
+                reviews = {review.id: review for review in result}
 
-            items.sort(key=lambda x: x["created_at"], reverse=True)
+            liked_quotes, liked_reviews = await self._bulk_liked_sets(
+                session, quote_ids, review_ids, viewer_id
+            )
 
-            start = (page - 1) * page_size
-            end = start + page_size
+        # Author and book info for the whole page, one batch each
+        authors, books = await fetch_authors_and_books([*quotes.values(), *reviews.values()])
 
-            return {
-                "items": items[start:end],
-                "total": len(items),
-                "page": page,
-                "page_size": page_size,
-                "has_more": end < len(items),
-            }
+        items = []
+        for row in page_rows:
+            if row.type == "quote":
+                quote = quotes.get(row.id)
+                if quote is not None:
+                    items.append(self._quote_to_feed_item(quote, liked_quotes, authors, books))
+            else:
+                review = reviews.get(row.id)
+                if review is not None:
+                    items.append(self._review_to_feed_item(review, liked_reviews, authors, books))
+
+        return {
+            "items": items,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "has_more": has_more,
+        }
 
     async def _get_following_ids(self, user_id: str) -> List[str]:
         """Get list of user IDs the user is following"""
         # TODO: Call user service to get following list
         return []
 
-    async def _check_liked(self, item_id: str, item_type: str, user_id: str) -> bool:
-        """Check if user liked an item"""
-        async with get_db_session() as session:
-            if item_type == "quote":
-                result = await session.execute(
-                    select(QuoteLike).where(
-                        QuoteLike.quote_id == item_id,
-                        QuoteLike.user_id == user_id,
-                    )
+    async def _bulk_liked_sets(
+        self,
+        session,
+        quote_ids: List[str],
+        review_ids: List[str],
+        user_id: str,
+    ) -> Tuple[Set[str], Set[str]]:
+        """Get the quote and review IDs among the given ones that the user liked"""
+        liked_quotes: Set[str] = set()
+        liked_reviews: Set[str] = set()
+        if not user_id:
+            return liked_quotes, liked_reviews
+
+        if quote_ids:
+            result = await session.scalars(
+                select(QuoteLike.quote_id).where(
+                    QuoteLike.quote_id.in_(quote_ids),
+                    QuoteLike.user_id == user_id,
                 )
-            else:
-                result = await session.execute(
-                    select(ReviewLike).where(
-                        ReviewLike.review_id == item_id,
-                        ReviewLike.user_id == user_id,
-                    )
+            )
+            liked_quotes = {str(quote_id) for quote_id in result}
+        if review_ids:
+            result = await session.scalars(
+                select(ReviewLike.review_id).where(
+                    ReviewLike.review_id.in_(review_ids),
+                    ReviewLike.user_id == user_id,
                 )
-            return result.scalar_one_or_none() is not None
-
-    async def _quote_to_feed_item(self, session, quote: Quote, viewer_id: str) -> dict:
-        """Convert quote to feed item"""
-        is_liked = await self._check_liked(quote.id, "quote", viewer_id)
+            )
+            liked_reviews = {str(review_id) for review_id in result}
 
-        return {
-            "id": str(quote.id),
-            "type": "quote",
-            "content": quote.content,
-            "author": {
-                "id": str(quote.user_id),
-                "nickname": "User",
-                "avatar_url": None,
-                "level": 1,
-            },
-            "book": {
-                "id": str(quote.book_id),
-                "title": "Book",
-                "author": "Author",
-                "cover_image_url": None,
-            },
-            "rating": None,
-            "page_number": quote.page_number,
-            "memo": quote.memo,
-            "likes_count": quote.likes_count or 0,
-            "comments_count": 0,
-            "is_liked": is_liked,
-            "created_at": quote.created_at,
-        }
+        return liked_quotes, liked_reviews
 
-    async def _review_to_feed_item(self, session, review: Review, viewer_id: str) -> dict:
+    def _quote_to_feed_item(
+        self,
+        quote: Quote,
+        liked_quote_ids: Set[str],
+        authors: Dict[str, dict],
+        books: Dict[str, dict],
+    ) -> FeedItemRaw:
+        """Convert quote to feed item"""
+        quote_id = str(quote.id)
+
+        return FeedItemRaw(
+            id=quote_id,
+            type="quote",
+            content=quote.content,
+            author=authors[str(quote.user_id)],
+            book=books[str(quote.book_id)],
+            created_at=quote.created_at,
+            page_number=quote.page_number,
+            memo=quote.memo,
+            likes_count=quote.likes_count or 0,
+            is_liked=quote_id in liked_quote_ids,
+        )
+
+    def _review_to_feed_item(
+        self,
+        review: Review,
+        liked_review_ids: Set[str],
+        authors: Dict[str, dict],
+        books: Dict[str, dict],
+    ) -> FeedItemRaw:
         """Convert review to feed item"""
-        is_liked = await self._check_liked(review.id, "review", viewer_id)
-
-        return {
-            "id": str(review.id),
-            "type": "review",
-            "content": review.content[:200] + "..." if len(review.content) > 200 else review.content,
-            "author": {
-                "id": str(review.user_id),
-                "nickname": "User",
-                "avatar_url": None,
-                "level": 1,
-            },
-            "book": {
-                "id": str(review.book_id),
-                "title": "Book",
-                "author": "Author",
-                "cover_image_url": None,
-            },
-            "rating": review.rating,
-            "page_number": None,
-            "has_spoiler": review.has_spoiler,
-            "likes_count": review.likes_count or 0,
-            "comments_count": 0,
-            "is_liked": is_liked,
-            "created_at": review.created_at,
-        }
+        review_id = str(review.id)
+        # The database caps the preview at one past the limit, so an
+        # over-long preview just drops that character for the ellipsis
+        preview = review.preview
+        if len(preview) > REVIEW_PREVIEW_LENGTH:
+            preview = preview[:REVIEW_PREVIEW_LENGTH] + "..."
+
+        return FeedItemRaw(
+            id=review_id,
+            type="review",
+            content=preview,
+            author=authors[str(review.user_id)],
+            book=books[str(review.book_id)],
+            created_at=review.created_at,
+            rating=review.rating,
+            has_spoiler=review.has_spoiler,
+            likes_count=review.likes_count or 0,
+            comments_count=review.comments_count,
+            is_liked=review_id in liked_review_ids,
+        )
+
+
+async def run_discover_warmer() -> None:
+    """Keep the first discover pages cached; one worker rebuilds per interval"""
+    feed_service = FeedService()
+    while True:
+        try:
+            if await cache_service.set_nx(
+                "discover:warm:lock", "1", ttl=DISCOVER_WARM_INTERVAL - 10
+            ):
+                await feed_service.warm_discover_feed()
+        except Exception as e:
+            print(f"Discover feed warm-up failed: {e}")
+        await asyncio.sleep(DISCOVER_WARM_INTERVAL)
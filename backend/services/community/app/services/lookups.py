@@ -0,0 +1,29 @@
+import asyncio
+from typing import Dict, Iterable, Set, Tuple
+
+
+async def bulk_fetch_users(user_ids: Set[str]) -> Dict[str, dict]:
+    """Get author info for many users at once, keyed by user ID"""
+    # TODO: Fetch from user service in one batched request
+    return {
+        user_id: {"id": user_id, "nickname": "User", "avatar_url": None, "level": 1}
+        for user_id in user_ids
+    }
+
+
+async def bulk_fetch_books(book_ids: Set[str]) -> Dict[str, dict]:
+    """Get book info for many books at once, keyed by book ID"""
+    # TODO: Fetch from book service in one batched request
+    return {
+        book_id: {"id": book_id, "title": "Book", "author": "Author", "cover_image_url": None}
+        for book_id in book_ids
+    }
+
+
+async def fetch_authors_and_books(rows: Iterable) -> Tuple[Dict[str, dict], Dict[str, dict]]:
+    """Resolve the distinct authors and books of a page concurrently"""
+    rows = list(rows)
+    return await asyncio.gather(
+        bulk_fetch_users({str(row.user_id) for row in rows}),
+        bulk_fetch_books({str(row.book_id) for row in rows}),
+    )
@@ -1,15 +1,28 @@
-from typing import Optional
-from datetime import datetime
-from uuid import uuid4
+from typing import Dict, Optional, Set
 
-from sqlalchemy import select, func, and_
-from sqlalchemy.orm import joinedload
+from sqlalchemy import select, func, update, delete, exists, literal
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from shared.core.database import get_db_session
+from .feed_service import invalidate_feed_caches
+from .lookups import fetch_authors_and_books
 from ..models.community import Quote, QuoteLike
 from ..schemas.community_schemas import QuoteCreateRequest, QuoteUpdateRequest
 
 
+# Columns read when rendering list items, so pages skip unused row data
+_QUOTE_LIST_COLUMNS = (
+    Quote.id,
+    Quote.user_id,
+    Quote.book_id,
+    Quote.content,
+    Quote.page_number,
+    Quote.is_public,
+    Quote.likes_count,
+    Quote.created_at,
+)
+
+
 class QuoteService:
     """Service for quote operations"""
 
@@ -17,20 +30,20 @@ class QuoteService:
         """Create a new quote"""
         async with get_db_session() as session:
             quote = Quote(
-                id=str(uuid4()),
                 user_id=user_id,
                 book_id=data.book_id,
                 content=data.content,
                 page_number=data.page_number,
-                thought=data.thought,
-                background_color=data.background_color,
                 is_public=data.is_public,
             )
             session.add(quote)
             await session.commit()
-            await session.refresh(quote)
+            await invalidate_feed_caches(user_id, data.book_id)
 
-            return await self.get_quote_by_id(quote.id, user_id)
+            # Render from the same session's object instead of reloading it
+            # through get_quote_by_id on a second pooled connection
+            authors, books = await fetch_authors_and_books([quote])
+            return self._quote_to_dict(quote, set(), authors, books)
 
     async def get_quote_by_id(self, quote_id: str, viewer_id: str) -> Optional[dict]:
         """Get quote by ID"""
@@ -46,7 +59,9 @@ class QuoteService:
             if not quote.is_public and quote.user_id != viewer_id:
                 return None
 
-            return await self._quote_to_dict(session, quote, viewer_id)
+            liked_ids = await self._liked_quote_ids(session, [quote.id], viewer_id)
+            authors, books = await fetch_authors_and_books([quote])
+            return self._quote_to_dict(quote, liked_ids, authors, books)
 
     async def get_quotes(
         self,
@@ -58,36 +73,33 @@ class QuoteService:
     ) -> dict:
         """Get quotes with filters"""
         async with get_db_session() as session:
-            query = select(Quote).where(Quote.is_public == True)
+            query = select(*_QUOTE_LIST_COLUMNS).where(Quote.is_public == True)
 
             if book_id:
                 query = query.where(Quote.book_id == book_id)
             if user_id:
                 query = query.where(Quote.user_id == user_id)
 
-            # Count total
-            count_query = select(func.count()).select_from(query.subquery())
-            count_result = await session.execute(count_query)
-            total = count_result.scalar() or 0
-
             # Paginate
-            query = query.order_by(Quote.created_at.desc())
-            query = query.offset((page - 1) * page_size).limit(page_size)
+            query = query.order_by(Quote.created_at.desc(), Quote.id.desc())
+            # Fetch one extra row to detect a next page without a COUNT
+            query = query.offset((page - 1) * page_size).limit(page_size + 1)
 
             result = await session.execute(query)
-            quotes = result.scalars().all()
+            quotes = result.all()
+            has_more = len(quotes) > page_size
+            quotes = quotes[:page_size]
 
-            items = [
-                await self._quote_to_dict(session, q, viewer_id)
-                for q in quotes
-            ]
+            liked_ids = await self._liked_quote_ids(session, [q.id for q in quotes], viewer_id)
+            authors, books = await fetch_authors_and_books(quotes)
+            items = [self._quote_to_dict(q, liked_ids, authors, books) for q in quotes]
 
             return {
                 "items": items,
-                "total": total,
+                "total": None,
                 "page": page,
                 "page_size": page_size,
-                "has_more": page * page_size < total,
+                "has_more": has_more,
             }
 
     async def update_quote(
@@ -97,30 +109,29 @@ class QuoteService:
         data: QuoteUpdateRequest,
     ) -> Optional[dict]:
         """Update a quote"""
+        # Only content and is_public are stored on quotes
+        values = {
+            key: value
+            for key, value in (("content", data.content), ("is_public", data.is_public))
+            if value is not None
+        }
         async with get_db_session() as session:
-            result = await session.execute(
-                select(Quote).where(
-                    Quote.id == quote_id,
-                    Quote.user_id == user_id,
-                )
+            # Ownership check, write and read back in one statement; an empty
+            # update rewrites content with itself so the row still comes back
+            quote = await session.scalar(
+                update(Quote)
+                .where(Quote.id == quote_id, Quote.user_id == user_id)
+                .values(values or {"content": Quote.content})
+                .returning(Quote)
             )
-            quote = result.scalar_one_or_none()
             if not quote:
                 return None
 
-            if data.content is not None:
-                quote.content = data.content
-            if data.thought is not None:
-                quote.thought = data.thought
-            if data.background_color is not None:
-                quote.background_color = data.background_color
-            if data.is_public is not None:
-                quote.is_public = data.is_public
-
-            quote.updated_at = datetime.utcnow()
+            liked_ids = await self._liked_quote_ids(session, [quote.id], user_id)
             await session.commit()
-
-            return await self.get_quote_by_id(quote_id, user_id)
+            await invalidate_feed_caches(user_id, str(quote.book_id))
+            authors, books = await fetch_authors_and_books([quote])
+            return self._quote_to_dict(quote, liked_ids, authors, books)
 
     async def delete_quote(self, quote_id: str, user_id: str) -> bool:
         """Delete a quote"""
@@ -137,92 +148,91 @@ class QuoteService:
 
             await session.delete(quote)
             await session.commit()
+            await invalidate_feed_caches(user_id, str(quote.book_id))
             return True
 
     async def like_quote(self, quote_id: str, user_id: str) -> bool:
         """Like a quote"""
         async with get_db_session() as session:
-            # Check quote exists
-            result = await session.execute(
-                select(Quote).where(Quote.id == quote_id)
-            )
-            if not result.scalar_one_or_none():
-                return False
-
-            # Check not already liked
-            existing = await session.execute(
-                select(QuoteLike).where(
-                    QuoteLike.quote_id == quote_id,
-                    QuoteLike.user_id == user_id,
+            # Insert the like only if the quote exists and bump the counter in
+            # the same statement; duplicates insert nothing and bump nothing
+            inserted = (
+                pg_insert(QuoteLike)
+                .from_select(
+                    ["quote_id", "user_id"],
+                    select(Quote.id, literal(user_id, QuoteLike.user_id.type))
+                    .where(Quote.id == quote_id),
                 )
+                .on_conflict_do_nothing(index_elements=["quote_id", "user_id"])
+                .returning(QuoteLike.quote_id)
+                .cte("inserted")
             )
-            if existing.scalar_one_or_none():
-                return True  # Already liked
-
-            like = QuoteLike(
-                id=str(uuid4()),
-                quote_id=quote_id,
-                user_id=user_id,
+            liked = await session.scalar(
+                update(Quote)
+                .where(Quote.id.in_(select(inserted.c.quote_id)))
+                .values(likes_count=func.coalesce(Quote.likes_count, 0) + 1)
+                .returning(Quote.id)
             )
-            session.add(like)
+            if liked is None:
+                # Either already liked or no such quote
+                return await session.scalar(select(exists().where(Quote.id == quote_id)))
+
             await session.commit()
             return True
 
     async def unlike_quote(self, quote_id: str, user_id: str) -> bool:
         """Unlike a quote"""
         async with get_db_session() as session:
-            result = await session.execute(
-                select(QuoteLike).where(
+            deleted = (
+                delete(QuoteLike)
+                .where(
                     QuoteLike.quote_id == quote_id,
                     QuoteLike.user_id == user_id,
                 )
+                .returning(QuoteLike.quote_id)
+                .cte("deleted")
+            )
+            unliked = await session.scalar(
+                update(Quote)
+                .where(Quote.id.in_(select(deleted.c.quote_id)))
+                .values(likes_count=func.greatest(func.coalesce(Quote.likes_count, 0) - 1, 0))
+                .returning(Quote.id)
             )
-            like = result.scalar_one_or_none()
-            if like:
-                await session.delete(like)
+            if unliked is not None:
                 await session.commit()
             return True
 
-    async def _quote_to_dict(self, session, quote: Quote, viewer_id: str) -> dict:
-        """Convert quote to response dict"""
-        # Get likes count
-        likes_result = await session.execute(
-            select(func.count()).where(QuoteLike.quote_id == quote.id)
-        )
-        likes_count = likes_result.scalar() or 0
-
-        # Check if viewer liked
-        is_liked = False
-        if viewer_id:
-            liked_result = await session.execute(
-                select(QuoteLike).where(
-                    QuoteLike.quote_id == quote.id,
-                    QuoteLike.user_id == viewer_id,
-                )
+    async def _liked_quote_ids(self, session, quote_ids: list, viewer_id: str) -> Set:
+        """Get the IDs among the given quotes that the viewer liked"""
+        if not viewer_id or not quote_ids:
+            return set()
+        result = await session.scalars(
+            select(QuoteLike.quote_id).where(
+                QuoteLike.quote_id.in_(quote_ids),
+                QuoteLike.user_id == viewer_id,
             )
-            is_liked = liked_result.scalar_one_or_none() is not None
+        )
+        return set(result)
 
-        # TODO: Get author and book info from respective services
+    def _quote_to_dict(
+        self,
+        quote: Quote,
+        liked_quote_ids: Set,
+        authors: Dict[str, dict],
+        books: Dict[str, dict],
+    ) -> dict:
+        """Convert quote to response dict"""
         return {
             "id": quote.id,
             "content": quote.content,
             "page_number": quote.page_number,
-            "thought": quote.thought,
-            "background_color": quote.background_color,
+            # Quotes have no thought or background_color columns
+            "thought": None,
+            "background_color": None,
             "is_public": quote.is_public,
-            "author": {
-                "id": quote.user_id,
-                "nickname": "User",  # TODO: Fetch from user service
-                "avatar_url": None,
-                "level": 1,
-            },
-            "book": {
-                "id": quote.book_id,
-                "title": "Book",  # TODO: Fetch from book service
-                "author": "Author",
-                "cover_image_url": None,
-            },
-            "likes_count": likes_count,
-            "is_liked": is_liked,
+            "author": authors[str(quote.user_id)],
+            "book": books[str(quote.book_id)],
+            "likes_count": quote.likes_count or 0,
+            "is_liked": quote.id in liked_quote_ids,
             "created_at": quote.created_at,
         }
@@ -1,14 +1,147 @@
-from typing import Optional
+import asyncio
+from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime
-from uuid import uuid4
+from uuid import UUID
+import base64
 
-from sqlalchemy import select, func
+from sqlalchemy import select, func, update, delete, exists, tuple_, values, column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from uuid6 import uuid7
 
 from shared.core.database import get_db_session
+from .feed_service import invalidate_feed_caches
+from .lookups import fetch_authors_and_books
 from ..models.community import Review, ReviewLike, Comment
 from ..schemas.community_schemas import ReviewCreateRequest, ReviewUpdateRequest
 
 
+# Columns read when rendering list items, so pages skip unused row data
+_REVIEW_LIST_COLUMNS = (
+    Review.id,
+    Review.user_id,
+    Review.book_id,
+    Review.rating,
+    Review.content,
+    Review.has_spoiler,
+    Review.is_public,
+    Review.likes_count,
+    Review.comments_count,
+    Review.created_at,
+    Review.updated_at,
+)
+
+
+def _encode_cursor(review) -> str:
+    """Encode the (created_at, id) seek position of a row"""
+    raw = f"{review.created_at.isoformat()}|{review.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode a cursor produced by _encode_cursor"""
+    created_at, review_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+    return datetime.fromisoformat(created_at), UUID(review_id)
+
+
+# Likes arriving within one window are written in one statement and commit
+LIKE_BATCH_WINDOW = 0.05  # seconds
+
+
+async def _write_likes(likes: List[Tuple[UUID, UUID]]) -> Set[Tuple[UUID, UUID]]:
+    """Insert many likes and bump their counters in one statement
+
+    Returns the (review_id, user_id) pairs whose review exists, which are
+    liked afterwards whether or not they were already.
+    """
+    id_type = ReviewLike.review_id.type
+    # INSERT ... SELECT evaluates a Python default once per statement, so
+    # each row carries its own uuid7 id
+    batch = select(
+        values(
+            column("id", id_type),
+            column("review_id", id_type),
+            column("user_id", id_type),
+            name="batch",
+        ).data([(uuid7(), review_id, user_id) for review_id, user_id in likes])
+    ).cte("likes")
+    inserted = (
+        pg_insert(ReviewLike)
+        .from_select(
+            ["id", "review_id", "user_id"],
+            select(batch.c.id, batch.c.review_id, batch.c.user_id)
+            .join(Review, Review.id == batch.c.review_id),
+        )
+        .on_conflict_do_nothing(index_elements=["review_id", "user_id"])
+        .returning(ReviewLike.review_id)
+        .cte("inserted")
+    )
+    added = (
+        select(inserted.c.review_id, func.count().label("n"))
+        .group_by(inserted.c.review_id)
+        .cte("added")
+    )
+    bumped = (
+        update(Review)
+        .where(Review.id == added.c.review_id)
+        .values(
+            likes_count=func.coalesce(Review.likes_count, 0) + added.c.n,
+            # Keep onupdate from marking the review as edited
+            updated_at=Review.updated_at,
+        )
+        .returning(Review.id)
+        .cte("bumped")
+    )
+
+    async with get_db_session() as session:
+        result = await session.execute(
+            select(batch.c.review_id, batch.c.user_id)
+            .join(Review, Review.id == batch.c.review_id)
+            .add_cte(bumped)
+        )
+        liked = set(result.tuples())
+        await session.commit()
+        return liked
+
+
+class _LikeBatcher:
+    """Coalesce concurrent review likes into one write per window"""
+
+    def __init__(self):
+        self._pending: List[Tuple[Tuple[UUID, UUID], asyncio.Future]] = []
+        self._flush: Optional[asyncio.Task] = None
+
+    async def like(self, review_id: str, user_id: str) -> bool:
+        """Queue a like and wait until the batch holding it has committed"""
+        try:
+            like = (UUID(review_id), UUID(user_id))
+        except ValueError:
+            return False
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((like, future))
+        if self._flush is None:
+            self._flush = asyncio.create_task(self._flush_after_window())
+        return await future
+
+    async def _flush_after_window(self) -> None:
+        """Write everything queued during the window"""
+        await asyncio.sleep(LIKE_BATCH_WINDOW)
+        pending, self._pending, self._flush = self._pending, [], None
+        try:
+            liked = await _write_likes(list(dict.fromkeys(like for like, _ in pending)))
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for like, future in pending:
+            if not future.done():
+                future.set_result(like in liked)
+
+
+_like_batcher = _LikeBatcher()
+
+
 class ReviewService:
     """Service for review operations"""
 
@@ -16,30 +149,33 @@ class ReviewService:
         """Create a new review"""
         async with get_db_session() as session:
             # Check if user already reviewed this book
-            existing = await session.execute(
-                select(Review).where(
-                    Review.user_id == user_id,
-                    Review.book_id == data.book_id,
+            if await session.scalar(
+                select(
+                    exists().where(
+                        Review.user_id == user_id,
+                        Review.book_id == data.book_id,
+                    )
                 )
-            )
-            if existing.scalar_one_or_none():
+            ):
                 raise ValueError("Already reviewed this book")
 
             review = Review(
-                id=str(uuid4()),
                 user_id=user_id,
                 book_id=data.book_id,
                 rating=data.rating,
-                title=data.title,
                 content=data.content,
-                contains_spoiler=data.contains_spoiler,
+                has_spoiler=data.contains_spoiler,
                 is_public=data.is_public,
             )
             session.add(review)
             await session.commit()
-            await session.refresh(review)
+            await invalidate_feed_caches(user_id, data.book_id)
 
-            return await self.get_review_by_id(review.id, user_id)
+            # Every column, id included, was set client-side at flush, so
+            # render the new row as is rather than reading it back; nobody
+            # has liked it yet
+            authors, books = await fetch_authors_and_books([review])
+            return self._review_to_dict(review, set(), authors, books)
 
     async def get_review_by_id(self, review_id: str, viewer_id: str) -> Optional[dict]:
         """Get review by ID"""
@@ -54,7 +190,9 @@ class ReviewService:
             if not review.is_public and review.user_id != viewer_id:
                 return None
 
-            return await self._review_to_dict(session, review, viewer_id)
+            liked_ids = await self._liked_review_ids(session, [review.id], viewer_id)
+            authors, books = await fetch_authors_and_books([review])
+            return self._review_to_dict(review, liked_ids, authors, books)
 
     async def get_reviews(
         self,
@@ -63,39 +201,57 @@ class ReviewService:
         viewer_id: str = None,
         page: int = 1,
         page_size: int = 20,
+        include_total: bool = False,
+        cursor: Optional[str] = None,
     ) -> dict:
         """Get reviews with filters"""
+        # Totals are only meaningful for offset pages over the full result
+        include_total = include_total and not cursor
         async with get_db_session() as session:
-            query = select(Review).where(Review.is_public == True)
+            columns = _REVIEW_LIST_COLUMNS
+            if include_total:
+                # Count matching rows in the same query instead of a second one
+                columns = (*columns, func.count().over().label("total"))
+            query = select(*columns).where(Review.is_public == True)
 
             if book_id:
                 query = query.where(Review.book_id == book_id)
             if user_id:
                 query = query.where(Review.user_id == user_id)
 
-            # Count total
-            count_query = select(func.count()).select_from(query.subquery())
-            count_result = await session.execute(count_query)
-            total = count_result.scalar() or 0
+            if cursor:
+                # Seek past the last row seen instead of scanning an offset
+                query = query.where(
+                    tuple_(Review.created_at, Review.id) < tuple_(*_decode_cursor(cursor))
+                )
+            else:
+                query = query.offset((page - 1) * page_size)
 
-            # Paginate
-            query = query.order_by(Review.created_at.desc())
-            query = query.offset((page - 1) * page_size).limit(page_size)
+            # Fetch one extra row to detect a next page without a COUNT
+            query = query.order_by(Review.created_at.desc(), Review.id.desc())
+            query = query.limit(page_size + 1)
 
             result = await session.execute(query)
-            reviews = result.scalars().all()
-
-            items = [
-                await self._review_to_dict(session, r, viewer_id)
-                for r in reviews
-            ]
+            reviews = result.all()
+            has_more = len(reviews) > page_size
+            reviews = reviews[:page_size]
+            total = None
+            if include_total:
+                # A page past the end has no rows to carry the count
+                total = reviews[0].total if reviews else (0 if page == 1 else None)
+
+            # Viewer likes for the whole page in one query
+            liked_ids = await self._liked_review_ids(session, [r.id for r in reviews], viewer_id)
+            authors, books = await fetch_authors_and_books(reviews)
+            items = [self._review_to_dict(r, liked_ids, authors, books) for r in reviews]
 
             return {
                 "items": items,
                 "total": total,
                 "page": page,
                 "page_size": page_size,
-                "has_more": page * page_size < total,
+                "has_more": has_more,
+                "next_cursor": _encode_cursor(reviews[-1]) if has_more and reviews else None,
             }
 
     async def update_review(
@@ -105,32 +261,34 @@ class ReviewService:
         data: ReviewUpdateRequest,
     ) -> Optional[dict]:
         """Update a review"""
+        # Reviews store no title; contains_spoiler maps onto has_spoiler
+        values = {
+            key: value
+            for key, value in (
+                ("rating", data.rating),
+                ("content", data.content),
+                ("has_spoiler", data.contains_spoiler),
+                ("is_public", data.is_public),
+            )
+            if value is not None
+        }
+        values["updated_at"] = datetime.utcnow()
         async with get_db_session() as session:
-            result = await session.execute(
-                select(Review).where(
-                    Review.id == review_id,
-                    Review.user_id == user_id,
-                )
+            # Ownership check, write and read back in one statement
+            review = await session.scalar(
+                update(Review)
+                .where(Review.id == review_id, Review.user_id == user_id)
+                .values(values)
+                .returning(Review)
             )
-            review = result.scalar_one_or_none()
             if not review:
                 return None
 
-            if data.rating is not None:
-                review.rating = data.rating
-            if data.title is not None:
-                review.title = data.title
-            if data.content is not None:
-                review.content = data.content
-            if data.contains_spoiler is not None:
-                review.contains_spoiler = data.contains_spoiler
-            if data.is_public is not None:
-                review.is_public = data.is_public
-
-            review.updated_at = datetime.utcnow()
+            liked_ids = await self._liked_review_ids(session, [review.id], user_id)
             await session.commit()
-
-            return await self.get_review_by_id(review_id, user_id)
+            await invalidate_feed_caches(user_id, str(review.book_id))
+            authors, books = await fetch_authors_and_books([review])
+            return self._review_to_dict(review, liked_ids, authors, books)
 
     async def delete_review(self, review_id: str, user_id: str) -> bool:
         """Delete a review"""
@@ -147,47 +305,37 @@ class ReviewService:
 
             await session.delete(review)
             await session.commit()
+            await invalidate_feed_caches(user_id, str(review.book_id))
             return True
 
     async def like_review(self, review_id: str, user_id: str) -> bool:
         """Like a review"""
-        async with get_db_session() as session:
-            result = await session.execute(
-                select(Review).where(Review.id == review_id)
-            )
-            if not result.scalar_one_or_none():
-                return False
-
-            existing = await session.execute(
-                select(ReviewLike).where(
-                    ReviewLike.review_id == review_id,
-                    ReviewLike.user_id == user_id,
-                )
-            )
-            if existing.scalar_one_or_none():
-                return True
-
-            like = ReviewLike(
-                id=str(uuid4()),
-                review_id=review_id,
-                user_id=user_id,
-            )
-            session.add(like)
-            await session.commit()
-            return True
+        # Bursts of likes share one INSERT and one commit; each caller still
+        # returns only after its like is durable
+        return await _like_batcher.like(review_id, user_id)
 
     async def unlike_review(self, review_id: str, user_id: str) -> bool:
         """Unlike a review"""
         async with get_db_session() as session:
-            result = await session.execute(
-                select(ReviewLike).where(
+            deleted = (
+                delete(ReviewLike)
+                .where(
                     ReviewLike.review_id == review_id,
                     ReviewLike.user_id == user_id,
                 )
+                .returning(ReviewLike.review_id)
+                .cte("deleted")
+            )
+            unliked = await session.scalar(
+                update(Review)
+                .where(Review.id.in_(select(deleted.c.review_id)))
+                .values(
+                    likes_count=func.greatest(func.coalesce(Review.likes_count, 0) - 1, 0),
+                    updated_at=Review.updated_at,
+                )
+                .returning(Review.id)
             )
-            like = result.scalar_one_or_none()
-            if like:
-                await session.delete(like)
+            if unliked is not None:
                 await session.commit()
             return True
 
@@ -199,22 +347,29 @@ class ReviewService:
     ) -> Optional[dict]:
         """Add a comment to a review"""
         async with get_db_session() as session:
-            result = await session.execute(
-                select(Review).where(Review.id == review_id)
+            # Count the comment up front; no row back means no such review
+            counted = await session.scalar(
+                update(Review)
+                .where(Review.id == review_id)
+                .values(
+                    comments_count=Review.comments_count + 1,
+                    updated_at=Review.updated_at,
+                )
+                .returning(Review.id)
             )
-            if not result.scalar_one_or_none():
+            if counted is None:
                 return None
 
             comment = Comment(
-                id=str(uuid4()),
-                review_id=review_id,
                 user_id=user_id,
+                parent_type="review",
+                parent_id=review_id,
                 content=content,
             )
             session.add(comment)
             await session.commit()
-            await session.refresh(comment)
 
+            # id and created_at were set client-side at flush; no read-back
             return {
                 "id": comment.id,
                 "content": comment.content,
@@ -227,53 +382,38 @@ class ReviewService:
                 "created_at": comment.created_at,
             }
 
-    async def _review_to_dict(self, session, review: Review, viewer_id: str) -> dict:
-        """Convert review to response dict"""
-        # Get likes count
-        likes_result = await session.execute(
-            select(func.count()).where(ReviewLike.review_id == review.id)
-        )
-        likes_count = likes_result.scalar() or 0
-
-        # Get comments count
-        comments_result = await session.execute(
-            select(func.count()).where(Comment.review_id == review.id)
-        )
-        comments_count = comments_result.scalar() or 0
-
-        # Check if viewer liked
-        is_liked = False
-        if viewer_id:
-            liked_result = await session.execute(
-                select(ReviewLike).where(
-                    ReviewLike.review_id == review.id,
-                    ReviewLike.user_id == viewer_id,
-                )
+    async def _liked_review_ids(self, session, review_ids: list, viewer_id: str) -> Set:
+        """Get the IDs among the given reviews that the viewer liked"""
+        if not viewer_id or not review_ids:
+            return set()
+        result = await session.scalars(
+            select(ReviewLike.review_id).where(
+                ReviewLike.review_id.in_(review_ids),
+                ReviewLike.user_id == viewer_id,
             )
-            is_liked = liked_result.scalar_one_or_none() is not None
+        )
+        return set(result)
 
+    def _review_to_dict(
+        self,
+        review: Review,
+        liked_review_ids: Set,
+        authors: Dict[str, dict],
+        books: Dict[str, dict],
+    ) -> dict:
+        """Convert review to response dict"""
         return {
             "id": review.id,
             "rating": review.rating,
-            "title": review.title,
+            "title": None,  # Reviews have no stored title
             "content": review.content,
-            "contains_spoiler": review.contains_spoiler,
+            "contains_spoiler": review.has_spoiler,
             "is_public": review.is_public,
-            "author": {
-                "id": review.user_id,
-                "nickname": "User",
-                "avatar_url": None,
-                "level": 1,
-            },
-            "book": {
-                "id": review.book_id,
-                "title": "Book",
-                "author": "Author",
-                "cover_image_url": None,
-            },
-            "likes_count": likes_count,
-            "comments_count": comments_count,
-            "is_liked": is_liked,
+            "author": authors[str(review.user_id)],
+            "book": books[str(review.book_id)],
+            "likes_count": review.likes_count or 0,
+            "comments_count": review.comments_count or 0,
+            "is_liked": review.id in liked_review_ids,
             "created_at": review.created_at,
             "updated_at": review.updated_at,
         }
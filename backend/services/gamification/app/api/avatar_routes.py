@@ -10,8 +10,11 @@ from ..services.avatar_service import AvatarService
 router = APIRouter()
 
 
+_avatar_service = AvatarService()
+
+
 def get_avatar_service() -> AvatarService:
-    return AvatarService()
+    return _avatar_service
 
 
 @router.get("/config", response_model=AvatarConfigResponse)
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from typing import List
 
 from shared.middleware.auth import get_current_user
@@ -7,21 +7,28 @@ from ..schemas.gamification_schemas import (
     UserBadgeResponse,
     BadgeProgressResponse,
 )
-from ..services.badge_service import BadgeService
+from ..services.badge_service import BADGES_CACHE_KEY, BadgeService
+from .caching import config_response
 
 router = APIRouter()
 
 
+_badge_service = BadgeService()
+
+
 def get_badge_service() -> BadgeService:
-    return BadgeService()
+    return _badge_service
 
 
 @router.get("/", response_model=List[BadgeResponse])
 async def get_all_badges(
+    request: Request,
     service: BadgeService = Depends(get_badge_service),
 ):
     """Get all available badges"""
-    return await service.get_all_badges()
+    return await config_response(
+        request, BADGES_CACHE_KEY, service.get_all_badges, List[BadgeResponse]
+    )
 
 
 @router.get("/me", response_model=List[UserBadgeResponse])
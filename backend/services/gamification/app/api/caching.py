@@ -0,0 +1,55 @@
+import hashlib
+from functools import lru_cache
+from typing import Any, Awaitable, Callable
+
+import orjson
+from fastapi import Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+
+from shared.core.redis import cache_service
+
+# Config lists change only on deploys or seeding, so clients may reuse them
+CONFIG_MAX_AGE = 300
+CONFIG_CACHE_TTL = 300
+
+
+@lru_cache(maxsize=None)
+def _adapter(response_model: Any) -> TypeAdapter:
+    """Build the validator for a route's response model once"""
+    return TypeAdapter(response_model)
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the client's If-None-Match covers the current ETag"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return "*" in tags or etag in tags
+
+
+async def config_response(
+    request: Request,
+    cache_key: str,
+    load: Callable[[], Awaitable[Any]],
+    response_model: Any,
+) -> Response:
+    """Serve a config list with an ETag, answering 304 when the client is current"""
+    cached = await cache_service.get(cache_key)
+    if cached is None:
+        # Validate and filter like response_model would, since a returned
+        # Response bypasses it
+        adapter = _adapter(response_model)
+        data = adapter.dump_python(adapter.validate_python(await load()), mode="json")
+        body = orjson.dumps(data)
+        cached = {"etag": f'"{hashlib.sha1(body).hexdigest()}"', "data": data}
+        await cache_service.set(cache_key, cached, ttl=CONFIG_CACHE_TTL)
+
+    headers = {
+        "ETag": cached["etag"],
+        "Cache-Control": f"public, max-age={CONFIG_MAX_AGE}",
+    }
+    if _etag_matches(request, cached["etag"]):
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse(cached["data"], headers=headers)
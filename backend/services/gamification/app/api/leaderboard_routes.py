@@ -8,8 +8,11 @@ from ..services.leaderboard_service import LeaderboardService
 router = APIRouter()
 
 
+_leaderboard_service = LeaderboardService()
+
+
 def get_leaderboard_service() -> LeaderboardService:
-    return LeaderboardService()
+    return _leaderboard_service
 
 
 @router.get("/reading-time", response_model=LeaderboardResponse)
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from typing import List
 
 from shared.middleware.auth import get_current_user
@@ -8,12 +8,16 @@ from ..schemas.gamification_schemas import (
     LevelConfigResponse,
 )
 from ..services.level_service import LevelService
+from .caching import config_response
 
 router = APIRouter()
 
 
+_level_service = LevelService()
+
+
 def get_level_service() -> LevelService:
-    return LevelService()
+    return _level_service
 
 
 @router.get("/me", response_model=UserLevelResponse)
@@ -27,10 +31,13 @@ async def get_my_level(
 
 @router.get("/config", response_model=List[LevelConfigResponse])
 async def get_level_config(
+    request: Request,
     service: LevelService = Depends(get_level_service),
 ):
     """Get level configuration (exp requirements per level)"""
-    return await service.get_level_config()
+    return await config_response(
+        request, "config:levels", service.get_level_config, List[LevelConfigResponse]
+    )
 
 
 @router.get("/exp-history", response_model=List[ExpHistoryResponse])
@@ -11,8 +11,11 @@ from ..services.room_service import RoomService
 router = APIRouter()
 
 
+_room_service = RoomService()
+
+
 def get_room_service() -> RoomService:
-    return RoomService()
+    return _room_service
 
 
 @router.get("/layout", response_model=RoomLayoutResponse)
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from typing import List, Optional
 from uuid import uuid4
 
@@ -6,6 +6,7 @@ from sqlalchemy import select
 
 from shared.middleware.auth import get_current_user
 from shared.core.database import get_db_session
+from shared.core.redis import cache_service
 from ..schemas.gamification_schemas import (
     ShopItemResponse,
     UserInventoryResponse,
@@ -15,21 +16,31 @@ from ..schemas.gamification_schemas import (
 )
 from ..services.shop_service import ShopService
 from ..models.gamification import ShopItem
+from .caching import config_response
 
 router = APIRouter()
 
 
+_shop_service = ShopService()
+
+
 def get_shop_service() -> ShopService:
-    return ShopService()
+    return _shop_service
 
 
 @router.get("/items", response_model=List[ShopItemResponse])
 async def get_shop_items(
+    request: Request,
     category: Optional[str] = Query(None),
     service: ShopService = Depends(get_shop_service),
 ):
     """Get available shop items"""
-    return await service.get_shop_items(category=category)
+    return await config_response(
+        request,
+        f"config:shop_items:{category or 'all'}",
+        lambda: service.get_shop_items(category=category),
+        List[ShopItemResponse],
+    )
 
 
 @router.get("/inventory", response_model=List[UserInventoryResponse])
@@ -713,6 +724,9 @@ async def seed_pixel_items():
 
         await session.commit()
 
+    # Drop cached item lists so clients pick up the new ETag
+    await cache_service.delete_pattern("config:shop_items:*")
+
     return {
         "status": "success",
         "added_items": added,
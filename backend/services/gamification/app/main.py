@@ -1,12 +1,30 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from shared.core.config import settings
+from shared.core.database import close_db, warmup_db_pool
 from .api import router
+from .services.leaderboard_service import run_leaderboard_refresher
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan handler"""
+    await warmup_db_pool(settings.DB_POOL_WARMUP)
+    leaderboard_refresher = asyncio.create_task(run_leaderboard_refresher())
+    yield
+    leaderboard_refresher.cancel()
+    await close_db()
+
 
 app = FastAPI(
     title="ReadLock Gamification Service",
     version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
 )
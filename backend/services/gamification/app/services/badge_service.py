@@ -5,8 +5,12 @@ from uuid import uuid4
 from sqlalchemy import select
 
 from shared.core.database import get_db_session
+from shared.core.redis import cache_service
 from ..models.gamification import Badge, UserBadge, UserLevel, UserCoins, CoinTransaction, ExpHistory
 
+# Cached badge list served by GET /badges/, see api/caching.py
+BADGES_CACHE_KEY = "config:badges"
+
 
 class BadgeService:
     """Service for badge management"""
@@ -157,6 +161,10 @@ class BadgeService:
                     return False
                 badge = Badge(**badge_def)
                 session.add(badge)
+                # Store the definition on its own so the cached list can be
+                # dropped once the row is visible
+                await session.commit()
+                await cache_service.delete(BADGES_CACHE_KEY)
 
             user_stats = await self._get_user_stats(user_id)
             current, required = self._calculate_progress(badge.requirements, user_stats)
@@ -1,12 +1,96 @@
+import asyncio
 from typing import List, Optional
 from datetime import datetime, timedelta
 
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func, and_, table, column, text
 
 from shared.core.database import get_db_session
+from shared.core.redis import cache_service, get_redis
 from ..models.gamification import UserLevel
 
 
+# Ranked per-user scores per (type, period), see migration 016
+LEADERBOARD_PERIODS = ("daily", "weekly", "monthly", "all_time")
+LEADERBOARD_REFRESH_INTERVAL = 300  # 5 minutes
+# Published sorted sets outlive one missed refresh, then fall back to the views
+LEADERBOARD_CACHE_TTL = LEADERBOARD_REFRESH_INTERVAL * 3
+_LEADERBOARD_VIEWS = {
+    (leaderboard_type, period): table(
+        f"lb_{leaderboard_type}_{period}",
+        column("user_id"),
+        column("score"),
+        column("level"),
+        column("rank"),
+    )
+    for leaderboard_type in ("reading_time", "books_completed")
+    for period in LEADERBOARD_PERIODS
+}
+# Current streaks, kept by the reading service; streaks have no period
+_READING_STREAKS = table("reading_streaks", column("user_id"), column("current_streak"))
+
+
+async def refresh_leaderboard_views() -> None:
+    """Recompute the materialized leaderboards without blocking readers"""
+    async with get_db_session() as session:
+        for view in _LEADERBOARD_VIEWS.values():
+            await session.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view.name}"))
+
+
+def _leaderboard_key(leaderboard_type: str, period: str) -> str:
+    """Redis sorted set holding a published leaderboard"""
+    return f"lb:v2:{leaderboard_type}:{period}"
+
+
+def _decode_entry(entry: str) -> tuple:
+    """Split a published "rank:score:level" entry"""
+    rank, score, level = entry.split(":")
+    return int(rank), int(score), int(level)
+
+
+async def publish_leaderboards() -> None:
+    """Copy the refreshed views into Redis for ranked reads"""
+    client = await get_redis()
+    async with get_db_session() as session:
+        for (leaderboard_type, period), view in _LEADERBOARD_VIEWS.items():
+            result = await session.execute(
+                select(view.c.user_id, view.c.score, view.c.level, view.c.rank)
+                .order_by(view.c.rank, view.c.user_id)
+            )
+            rows = result.all()
+            key = _leaderboard_key(leaderboard_type, period)
+
+            # The set is scored by position in the view's (rank, user_id)
+            # order, and the hash keeps the view's RANK() so ties match it
+            async with client.pipeline(transaction=True) as pipe:
+                pipe.delete(key, f"{key}:entries")
+                if rows:
+                    pipe.zadd(key, {str(row.user_id): i for i, row in enumerate(rows)})
+                    pipe.hset(
+                        f"{key}:entries",
+                        mapping={
+                            str(row.user_id): f"{row.rank}:{int(row.score)}:{row.level}"
+                            for row in rows
+                        },
+                    )
+                    pipe.expire(key, LEADERBOARD_CACHE_TTL)
+                    pipe.expire(f"{key}:entries", LEADERBOARD_CACHE_TTL)
+                await pipe.execute()
+
+
+async def run_leaderboard_refresher() -> None:
+    """Refresh leaderboards periodically; one worker refreshes per interval"""
+    while True:
+        try:
+            if await cache_service.set_nx(
+                "leaderboard:refresh:lock", "1", ttl=LEADERBOARD_REFRESH_INTERVAL - 30
+            ):
+                await refresh_leaderboard_views()
+                await publish_leaderboards()
+        except Exception as e:
+            print(f"Leaderboard view refresh failed: {e}")
+        await asyncio.sleep(LEADERBOARD_REFRESH_INTERVAL)
+
+
 class LeaderboardService:
     """Service for leaderboard management"""
 
@@ -18,9 +102,6 @@ class LeaderboardService:
         limit: int,
     ) -> dict:
         """Get leaderboard data"""
-        # TODO: Implement actual leaderboard queries
-        # This is a placeholder implementation
-
         entries = await self._get_leaderboard_entries(leaderboard_type, period, limit)
         user_rank, user_score = await self._get_user_rank(user_id, leaderboard_type, period)
 
@@ -73,15 +154,19 @@ class LeaderboardService:
         limit: int,
     ) -> List[dict]:
         """Get leaderboard entries based on type and period"""
-        # TODO: Implement actual queries based on leaderboard_type
-        # - reading_time: Sum of reading minutes in period
-        # - books_completed: Count of books completed in period
-        # - streak: Current streak length
-        # - level: User level
+        view = _LEADERBOARD_VIEWS.get((leaderboard_type, period))
+        if view is not None:
+            entries = await self._get_cached_leaderboard(leaderboard_type, period, limit)
+            if entries is None:
+                entries = await self._get_view_leaderboard(view, limit)
+            return entries
 
         if leaderboard_type == "level":
             return await self._get_level_leaderboard(limit)
 
+        if leaderboard_type == "streak":
+            return await self._get_streak_leaderboard(limit)
+
         # Placeholder data
         return [
             {
@@ -119,6 +204,85 @@ class LeaderboardService:
                 for i, ul in enumerate(user_levels)
             ]
 
+    async def _get_streak_leaderboard(self, limit: int) -> List[dict]:
+        """Get leaderboard by current reading streak"""
+        streaks = _READING_STREAKS
+        async with get_db_session() as session:
+            result = await session.execute(
+                select(streaks.c.user_id, streaks.c.current_streak, UserLevel.level)
+                .outerjoin(UserLevel, UserLevel.user_id == streaks.c.user_id)
+                .where(streaks.c.current_streak > 0)
+                .order_by(streaks.c.current_streak.desc(), streaks.c.user_id)
+                .limit(limit)
+            )
+            rows = result.all()
+
+        # Ties share a rank, as RANK() gives the other boards
+        entries = []
+        for i, row in enumerate(rows):
+            if i == 0 or row.current_streak != rows[i - 1].current_streak:
+                rank = i + 1
+            entries.append({
+                "rank": rank,
+                "user_id": str(row.user_id),
+                "username": f"User {str(row.user_id)[:8]}",
+                "avatar_url": None,
+                "level": row.level or 1,
+                "score": row.current_streak,
+                "is_current_user": False,
+            })
+        return entries
+
+    async def _get_cached_leaderboard(
+        self,
+        leaderboard_type: str,
+        period: str,
+        limit: int,
+    ) -> Optional[List[dict]]:
+        """Read the top of a published leaderboard; None if not published"""
+        key = _leaderboard_key(leaderboard_type, period)
+        client = await get_redis()
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.exists(key)
+            pipe.zrange(key, 0, limit - 1)
+            published, top = await pipe.execute()
+        if not published:
+            return None
+
+        entries = await client.hmget(f"{key}:entries", top) if top else []
+        return [
+            {
+                "rank": rank,
+                "user_id": user_id,
+                "username": f"User {user_id[:8]}",
+                "avatar_url": None,
+                "level": level,
+                "score": score,
+                "is_current_user": False,
+            }
+            for user_id, (rank, score, level) in zip(top, map(_decode_entry, entries))
+        ]
+
+    async def _get_view_leaderboard(self, view, limit: int) -> List[dict]:
+        """Read the top of a materialized leaderboard"""
+        async with get_db_session() as session:
+            result = await session.execute(
+                select(view).order_by(view.c.rank, view.c.user_id).limit(limit)
+            )
+
+            return [
+                {
+                    "rank": row.rank,
+                    "user_id": str(row.user_id),
+                    "username": f"User {str(row.user_id)[:8]}",
+                    "avatar_url": None,
+                    "level": row.level,
+                    "score": row.score,
+                    "is_current_user": False,
+                }
+                for row in result
+            ]
+
     async def _get_user_rank(
         self,
         user_id: str,
@@ -126,8 +290,43 @@ class LeaderboardService:
         period: str,
     ) -> tuple:
         """Get user's rank and score"""
-        # TODO: Implement actual rank calculation
-        return 15, 500
+        if leaderboard_type == "streak":
+            return await self._get_streak_rank(user_id)
+
+        view = _LEADERBOARD_VIEWS.get((leaderboard_type, period))
+        if view is None:
+            # TODO: Implement actual rank calculation
+            return 15, 500
+
+        key = _leaderboard_key(leaderboard_type, period)
+        client = await get_redis()
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.exists(key)
+            pipe.hget(f"{key}:entries", user_id)
+            published, entry = await pipe.execute()
+        if published:
+            return _decode_entry(entry)[:2] if entry is not None else (None, None)
+
+        async with get_db_session() as session:
+            result = await session.execute(
+                select(view.c.rank, view.c.score).where(view.c.user_id == user_id)
+            )
+            row = result.first()
+            return (row.rank, row.score) if row else (None, None)
+
+    async def _get_streak_rank(self, user_id: str) -> tuple:
+        """Get user's streak rank and length"""
+        streaks = _READING_STREAKS
+        async with get_db_session() as session:
+            streak = await session.scalar(
+                select(streaks.c.current_streak).where(streaks.c.user_id == user_id)
+            )
+            if not streak:
+                return None, None
+            ahead = await session.scalar(
+                select(func.count()).select_from(streaks).where(streaks.c.current_streak > streak)
+            )
+            return ahead + 1, streak
 
     async def _get_friend_ids(self, user_id: str) -> List[str]:
         """Get list of friend user IDs"""
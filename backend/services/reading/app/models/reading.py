@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, Date
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, Date, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
 
@@ -54,6 +54,14 @@ class ReadingSession(Base):
 class ReadingStreak(Base):
     """User reading streak tracking"""
     __tablename__ = "reading_streaks"
+    __table_args__ = (
+        # Streak leaderboard order, see migration 017
+        Index(
+            "ix_reading_streaks_current_streak",
+            text("current_streak DESC"), "user_id",
+            postgresql_where=text("current_streak > 0"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), unique=True, nullable=False)
@@ -2,7 +2,7 @@ from typing import Optional
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func
 
 from shared.core.database import get_db_session
 from shared.core.redis import cache_service
@@ -216,12 +216,8 @@ class SessionService:
                 query = query.where(ReadingSession.start_time <= end)
 
             # Count total
-            count_query = select(ReadingSession.id).where(
-                ReadingSession.user_id == user_id,
-                ReadingSession.is_active == False,
-            )
-            count_result = await session.execute(count_query)
-            total = len(count_result.all())
+            count_query = select(func.count()).select_from(query.subquery())
+            total = (await session.execute(count_query)).scalar_one()
 
             # Paginate
             query = query.order_by(ReadingSession.start_time.desc())
@@ -5,7 +5,7 @@ import hashlib
 from sqlalchemy import select
 
 from shared.core.database import get_db_session
-from shared.core.redis import cache_service
+from shared.core.redis import cache_service, nickname_filter
 from ..models.user import UserProfile, ReadingGoal
 from ..schemas.user_schemas import (
     ProfileUpdateRequest,
@@ -54,6 +54,8 @@ class ProfileService:
 
             # Invalidate cache
             await cache_service.delete(f"profile:{user_id}")
+            if data.nickname is not None:
+                await nickname_filter.add(data.nickname)
 
             return profile.to_dict()
 
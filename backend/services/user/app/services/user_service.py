@@ -5,6 +5,7 @@ from sqlalchemy import select, func
 from sqlalchemy.orm import joinedload
 
 from shared.core.database import get_db_session
+from shared.core.redis import nickname_filter
 from ..models.user import User, UserProfile, Follow
 from ..schemas.user_schemas import UserUpdateRequest
 
@@ -100,6 +101,8 @@ class UserService:
                 user.profile.updated_at = datetime.utcnow()
 
             await session.commit()
+            if user.profile and data.nickname is not None:
+                await nickname_filter.add(data.nickname)
             return await self.get_user_with_profile(user_id)
 
     async def search_users(
@@ -1,7 +1,9 @@
 """Database configuration and session management."""
+import asyncio
 import os
 from typing import AsyncGenerator
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -71,6 +73,16 @@ async def init_db() -> None:
         await conn.run_sync(Base.metadata.create_all)
 
 
+async def warmup_db_pool(size: int) -> None:
+    """Open pooled connections up front so first requests skip the connect."""
+    async def _ping() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    # Acquire concurrently so each ping checks out a distinct connection
+    await asyncio.gather(*(_ping() for _ in range(size)))
+
+
 async def close_db() -> None:
     """Close database connections."""
     await engine.dispose()
@@ -1,13 +1,17 @@
 """Redis connection and utilities."""
-import json
+import hashlib
 import os
 from typing import Any, Optional
 
+import orjson
 import redis.asyncio as redis
 
 # Redis URL from environment
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
+# dates and datetimes serialize natively; datetimes are written as UTC with "Z"
+_DUMPS_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
 # Redis client instance
 redis_client: Optional[redis.Redis] = None
 
@@ -26,6 +30,12 @@ async def get_redis() -> redis.Redis:
     return redis_client
 
 
+async def init_redis() -> None:
+    """Create the Redis client and verify the connection."""
+    client = await get_redis()
+    await client.ping()
+
+
 async def close_redis() -> None:
     """Close Redis connection."""
     global redis_client
@@ -42,16 +52,33 @@ class CacheService:
         self.redis = redis
         self.default_ttl = default_ttl
 
-    async def get(self, key: str) -> Optional[Any]:
-        """Get a value from cache."""
-        value = await self.redis.get(key)
+    @staticmethod
+    def _encode(value: Any) -> Any:
+        """Encode a value for storage."""
+        if isinstance(value, (dict, list)):
+            return orjson.dumps(value, option=_DUMPS_OPTIONS)
+        return value
+
+    @staticmethod
+    def _decode(value: Optional[str]) -> Optional[Any]:
+        """Decode a raw cached value."""
         if value is None:
             return None
         try:
-            return json.loads(value)
-        except json.JSONDecodeError:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
             return value
 
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a value from cache."""
+        return self._decode(await self.redis.get(key))
+
+    async def mget(self, keys: list[str]) -> list[Optional[Any]]:
+        """Get many values from cache in one round-trip."""
+        if not keys:
+            return []
+        return [self._decode(value) for value in await self.redis.mget(keys)]
+
     async def set(
         self,
         key: str,
@@ -61,10 +88,39 @@ class CacheService:
         """Set a value in cache."""
         ttl = ttl or self.default_ttl
 
-        if isinstance(value, (dict, list)):
-            value = json.dumps(value)
+        await self.redis.setex(key, ttl, self._encode(value))
+
+    async def set_nx(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        miss_counter: Optional[str] = None,
+    ) -> bool:
+        """Set a value only if absent, optionally counting the cache miss.
+
+        Returns True if this call stored the value.
+        """
+        ttl = ttl or self.default_ttl
+
+        value = self._encode(value)
+
+        # First writer wins; the miss counter rides the same round-trip
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.set(key, value, ex=ttl, nx=True)
+            if miss_counter:
+                pipe.incr(f"cache:miss:{miss_counter}")
+            stored, *_ = await pipe.execute()
+        return bool(stored)
+
+    async def mset(self, mapping: dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Set many values with a shared TTL in one round-trip."""
+        ttl = ttl or self.default_ttl
 
-        await self.redis.setex(key, ttl, value)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key, value in mapping.items():
+                pipe.set(key, self._encode(value), ex=ttl)
+            await pipe.execute()
 
     async def delete(self, key: str) -> None:
         """Delete a key from cache."""
@@ -92,6 +148,54 @@ class CacheService:
         await self.redis.expire(key, ttl)
 
 
+class BloomFilter:
+    """Bloom filter stored in a plain Redis bitmap."""
+
+    def __init__(self, key: str, size_bits: int = 1 << 24, num_hashes: int = 10):
+        # 2 MiB and 10 probes keep false positives near 0.1% at 1M entries
+        self.key = key
+        self.size_bits = size_bits
+        self.num_hashes = num_hashes
+
+    def _offsets(self, value: str) -> list[int]:
+        """Derive bit offsets with double hashing over one digest."""
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size_bits for i in range(self.num_hashes)]
+
+    async def add(self, *values: str) -> None:
+        """Add values to the filter."""
+        client = await get_redis()
+        async with client.pipeline(transaction=False) as pipe:
+            for value in values:
+                for offset in self._offsets(value):
+                    pipe.setbit(self.key, offset, 1)
+            await pipe.execute()
+
+    async def might_contain(self, values: list[str]) -> list[bool]:
+        """Check values; False means definitely absent."""
+        client = await get_redis()
+        async with client.pipeline(transaction=False) as pipe:
+            for value in values:
+                for offset in self._offsets(value):
+                    pipe.getbit(self.key, offset)
+            bits = await pipe.execute()
+
+        k = self.num_hashes
+        return [all(bits[i * k:(i + 1) * k]) for i in range(len(values))]
+
+    async def is_ready(self) -> bool:
+        """Check whether the filter has been fully populated."""
+        client = await get_redis()
+        return bool(await client.exists(f"{self.key}:ready"))
+
+    async def mark_ready(self) -> None:
+        """Mark the filter as fully populated."""
+        client = await get_redis()
+        await client.set(f"{self.key}:ready", 1)
+
+
 # Cache key generators
 def user_cache_key(user_id: str) -> str:
     """Generate cache key for user data."""
@@ -138,10 +242,28 @@ class CacheServiceProxy:
         svc = await get_cache_service()
         return await svc.get(key)
 
+    async def mget(self, keys: list[str]) -> list[Optional[Any]]:
+        svc = await get_cache_service()
+        return await svc.mget(keys)
+
     async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         svc = await get_cache_service()
         await svc.set(key, value, ttl)
 
+    async def set_nx(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        miss_counter: Optional[str] = None,
+    ) -> bool:
+        svc = await get_cache_service()
+        return await svc.set_nx(key, value, ttl, miss_counter)
+
+    async def mset(self, mapping: dict[str, Any], ttl: Optional[int] = None) -> None:
+        svc = await get_cache_service()
+        await svc.mset(mapping, ttl)
+
     async def delete(self, key: str) -> None:
         svc = await get_cache_service()
         await svc.delete(key)
@@ -157,3 +279,6 @@ class CacheServiceProxy:
 
 # Singleton proxy for cache service
 cache_service = CacheServiceProxy()
+
+# Nicknames that have ever been taken
+nickname_filter = BloomFilter("bloom:nicknames")
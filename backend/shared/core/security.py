@@ -1,5 +1,11 @@
 """Security utilities for authentication and authorization."""
+import asyncio
+import hashlib
 import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any, Optional
 from uuid import UUID
@@ -13,9 +19,26 @@ SECRET_KEY = os.getenv("SECRET_KEY", "your-super-secret-key-change-in-production
 ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
 REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7"))
+VERIFIED_TOKEN_CACHE_SIZE = 4096
+VERIFIED_TOKEN_CACHE_TTL = 60
 
 # Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Argon2id (OWASP 46 MiB profile) for new hashes; bcrypt kept so existing
+# hashes still verify.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__memory_cost=47104,
+    argon2__time_cost=2,
+    argon2__parallelism=1,
+)
+
+# Recently verified tokens: sha256(token) -> (cache expiry, token data)
+_verified_tokens: "OrderedDict[bytes, tuple[float, TokenData]]" = OrderedDict()
+
+# Worker pool for password hashing so the event loop is never blocked
+_hash_executor: Optional[ThreadPoolExecutor] = None
 
 
 class TokenData(BaseModel):
@@ -26,12 +49,13 @@ class TokenData(BaseModel):
     token_type: str = "access"
 
 
-class TokenPair(BaseModel):
+@dataclass(slots=True)
+class TokenPair:
     """Access and refresh token pair."""
     access_token: str
     refresh_token: str
-    token_type: str = "bearer"
     expires_in: int
+    token_type: str = "bearer"
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -44,6 +68,42 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def get_hash_executor() -> ThreadPoolExecutor:
+    """Get the password hashing worker pool."""
+    global _hash_executor
+
+    if _hash_executor is None:
+        _hash_executor = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1,
+            thread_name_prefix="password-hash",
+        )
+
+    return _hash_executor
+
+
+def close_hash_executor() -> None:
+    """Shut down the password hashing worker pool."""
+    global _hash_executor
+
+    if _hash_executor is not None:
+        _hash_executor.shutdown(wait=True)
+        _hash_executor = None
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against a hash on the hashing pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_hash_executor(), verify_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password on the hashing pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_hash_executor(), get_password_hash, password)
+
+
 def create_access_token(
     data: dict[str, Any],
     expires_delta: Optional[timedelta] = None,
@@ -121,6 +181,16 @@ def decode_token(token: str) -> Optional[TokenData]:
 
 def verify_token(token: str, token_type: str = "access") -> Optional[TokenData]:
     """Verify a token and check its type."""
+    key = hashlib.sha256(token.encode()).digest()
+    cached = _verified_tokens.get(key)
+
+    if cached is not None:
+        expires_at, token_data = cached
+        if expires_at > time.monotonic():
+            _verified_tokens.move_to_end(key)
+            return token_data if token_data.token_type == token_type else None
+        del _verified_tokens[key]
+
     token_data = decode_token(token)
 
     if token_data is None:
@@ -129,7 +199,17 @@ def verify_token(token: str, token_type: str = "access") -> Optional[TokenData]:
     if token_data.token_type != token_type:
         return None
 
-    if token_data.exp and token_data.exp < datetime.utcnow():
+    now = datetime.utcnow()
+    if token_data.exp and token_data.exp < now:
         return None
 
+    # Re-verifying an unchanged token within its lifetime adds nothing, so
+    # skip the signature check for a short window
+    ttl = VERIFIED_TOKEN_CACHE_TTL
+    if token_data.exp:
+        ttl = min(ttl, (token_data.exp - now).total_seconds())
+    _verified_tokens[key] = (time.monotonic() + ttl, token_data)
+    if len(_verified_tokens) > VERIFIED_TOKEN_CACHE_SIZE:
+        _verified_tokens.popitem(last=False)
+
     return token_data
@@ -1,9 +1,12 @@
 """Rate limiting middleware."""
+import math
 import time
+from collections import defaultdict
 from typing import Callable, Optional
 
 from fastapi import HTTPException, Request, status
 from fastapi.responses import JSONResponse
+from redis.exceptions import RedisError
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from ..core.redis import get_redis
@@ -28,49 +31,108 @@ class RateLimitExceeded(HTTPException):
 
 
 class RateLimiter:
-    """Rate limiter using Redis."""
+    """
+    Rate limiter using a per-process token bucket.
+
+    Requests are admitted from an in-memory bucket; consumed tokens are
+    pushed to Redis in one pipelined round-trip every `sync_interval`
+    seconds so that clients exceeding the limit across processes are
+    throttled for the rest of the window.
+    """
 
     def __init__(
         self,
         requests_per_minute: int = 60,
         burst_size: int = 10,
+        sync_interval: float = 1.0,
     ):
         self.requests_per_minute = requests_per_minute
         self.burst_size = burst_size
         self.window_size = 60  # 1 minute in seconds
+        self.sync_interval = sync_interval
+
+        self.capacity = float(requests_per_minute)
+        self.refill_rate = requests_per_minute / self.window_size
+
+        # key -> (tokens, last_refill monotonic time)
+        self._buckets: dict[str, tuple[float, float]] = {}
+        # key -> requests admitted since the last Redis sync
+        self._pending: defaultdict[str, int] = defaultdict(int)
+        # key -> monotonic time until which the key is throttled globally
+        self._blocked_until: dict[str, float] = {}
+        self._last_sync = time.monotonic()
 
     async def is_allowed(self, key: str) -> tuple[bool, int]:
         """
         Check if request is allowed.
         Returns (is_allowed, retry_after_seconds).
         """
-        redis = await get_redis()
-        current_time = int(time.time())
-        window_start = current_time - self.window_size
+        now = time.monotonic()
 
-        # Key for this rate limit window
-        rate_key = f"rate_limit:{key}"
+        blocked_until = self._blocked_until.get(key)
+        if blocked_until is not None:
+            if blocked_until > now:
+                return False, max(math.ceil(blocked_until - now), 1)
+            del self._blocked_until[key]
 
-        # Remove old entries
-        await redis.zremrangebyscore(rate_key, 0, window_start)
+        # Refill based on elapsed time
+        tokens, last_refill = self._buckets.get(key, (self.capacity, now))
+        tokens = min(self.capacity, tokens + (now - last_refill) * self.refill_rate)
 
-        # Count current requests
-        current_requests = await redis.zcard(rate_key)
+        if tokens < 1:
+            self._buckets[key] = (tokens, now)
+            retry_after = math.ceil((1 - tokens) / self.refill_rate)
+            return False, max(retry_after, 1)
 
-        if current_requests >= self.requests_per_minute:
-            # Get oldest request timestamp
-            oldest = await redis.zrange(rate_key, 0, 0, withscores=True)
-            if oldest:
-                retry_after = int(oldest[0][1]) + self.window_size - current_time
-                return False, max(retry_after, 1)
-            return False, self.window_size
+        self._buckets[key] = (tokens - 1, now)
+        self._pending[key] += 1
 
-        # Add current request
-        await redis.zadd(rate_key, {str(current_time): current_time})
-        await redis.expire(rate_key, self.window_size + 1)
+        if now - self._last_sync >= self.sync_interval:
+            await self._sync(now)
 
         return True, 0
 
+    async def _sync(self, now: float) -> None:
+        """Flush admitted counts to Redis and pick up global over-limit keys."""
+        self._last_sync = now
+        pending, self._pending = self._pending, defaultdict(int)
+
+        # Drop buckets that have fully refilled; they are equivalent to new ones
+        full_after = self.capacity / self.refill_rate
+        for key, (_, last_refill) in list(self._buckets.items()):
+            if now - last_refill >= full_after:
+                del self._buckets[key]
+        for key, blocked_until in list(self._blocked_until.items()):
+            if blocked_until <= now:
+                del self._blocked_until[key]
+
+        if not pending:
+            return
+
+        current_time = int(time.time())
+        window = current_time // self.window_size
+        retry_after = self.window_size - current_time % self.window_size
+
+        try:
+            redis = await get_redis()
+            async with redis.pipeline(transaction=False) as pipe:
+                for key, count in pending.items():
+                    rate_key = f"rate_limit:{key}:{window}"
+                    pipe.incrby(rate_key, count)
+                    pipe.expire(rate_key, self.window_size + 1)
+                results = await pipe.execute()
+        except RedisError as e:
+            # Keep the counts for the next sync; local buckets still limit
+            for key, count in pending.items():
+                self._pending[key] += count
+            print(f"Rate limit sync failed: {e}")
+            return
+
+        # Results alternate INCRBY total / EXPIRE ack per key
+        for key, total in zip(pending, results[::2]):
+            if total > self.requests_per_minute:
+                self._blocked_until[key] = now + retry_after
+
     def get_client_key(self, request: Request) -> str:
         """Get rate limit key for a client."""
         # Try to get user ID from request state (set by auth middleware)